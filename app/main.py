@@ -1,13 +1,16 @@
-from fastapi import FastAPI, Request, Response
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
 from fastapi.middleware.cors import CORSMiddleware
-import time
 import logging
+from contextlib import asynccontextmanager
 
-from .config import settings
-from .database import Base, engine, test_connection
+from .config import get_settings
+from .database import get_connection_status, init_db
 from .routers import trademark
 from .exceptions import register_exception_handlers
 
+settings = get_settings()
+
 # 로깅 설정
 logging.basicConfig(
     level=getattr(logging, settings.LOG_LEVEL),
@@ -15,21 +18,33 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# 데이터베이스 연결 테스트
-logger.info("애플리케이션 시작: 데이터베이스 연결 테스트 중...")
-db_connected = test_connection()
-if not db_connected:
-    logger.warning("데이터베이스 연결에 실패했습니다. 일부 기능이 작동하지 않을 수 있습니다.")
-else:
-    logger.info("데이터베이스 연결이 정상적으로 확인되었습니다.")
+# 운영 환경에서는 DEBUG 로그를 전역 비활성화 (요청 경로의 logger.debug 호출이 즉시 반환됨)
+if settings.ENVIRONMENT == "production":
+    logging.disable(logging.DEBUG)
+
+# 디버그 모드에서만 SQL 쿼리 로깅 활성화
+if settings.LOG_LEVEL == "DEBUG":
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
 
-try:
-    # DB 테이블 생성
-    logger.info("데이터베이스 테이블 생성 중...")
-    Base.metadata.create_all(bind=engine)
-    logger.info("데이터베이스 테이블 생성 완료")
-except Exception as e:
-    logger.error(f"데이터베이스 테이블 생성 실패: {str(e)}")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """애플리케이션 시작/종료 시 실행되는 작업"""
+    # 데이터베이스 연결 테스트
+    logger.info("애플리케이션 시작: 데이터베이스 연결 테스트 중...")
+    if not get_connection_status():
+        logger.warning("데이터베이스 연결에 실패했습니다. 일부 기능이 작동하지 않을 수 있습니다.")
+    else:
+        logger.info("데이터베이스 연결이 정상적으로 확인되었습니다.")
+        
+        # DB 테이블 및 트리거 생성 (RUN_MIGRATIONS 설정 시에만)
+        if settings.RUN_MIGRATIONS:
+            try:
+                init_db()
+            except Exception:
+                # 명시적으로 요청한 마이그레이션이 실패하면 불완전한 스키마로 서비스하지 않도록 시작 중단
+                logger.exception("데이터베이스 초기화 실패")
+                raise
+    yield
 
 app = FastAPI(
     title=settings.APP_NAME,
@@ -37,6 +52,8 @@ app = FastAPI(
     version=settings.APP_VERSION,
     docs_url="/docs",
     redoc_url="/redoc",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,  # orjson 기반 JSON 직렬화
 )
 
 # 전역 예외 핸들러 등록
@@ -48,10 +65,10 @@ app.add_middleware(
     CORSMiddleware,
     allow_origins=settings.CORS_ORIGINS,
     allow_credentials=True,
-    allow_methods=["GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"],
-    allow_headers=["Content-Type", "Authorization", "Accept", "X-Requested-With", "Set-Cookie"],
-    expose_headers=["Authorization", "Set-Cookie"],
-    max_age=3600,  # preflight 요청 캐싱 시간(초)
+    allow_methods=("GET", "POST", "PUT", "DELETE", "OPTIONS", "PATCH"),
+    allow_headers=("content-type", "authorization", "accept", "x-requested-with", "set-cookie"),  # 소문자로 미리 정규화
+    expose_headers=("Authorization", "Set-Cookie"),
+    max_age=86400,  # preflight 요청 캐싱 시간(초)
 )
 
 # 라우터 등록
@@ -70,8 +87,8 @@ def read_root():
 @app.get("/health")
 def health_check():
     """서버 상태 확인 엔드포인트"""
-    # 데이터베이스 연결 상태 확인
-    db_status = "connected" if test_connection() else "disconnected"
+    # 데이터베이스 연결 상태 확인 (캐시된 결과 사용)
+    db_status = "connected" if get_connection_status() else "disconnected"
     return {
         "status": "ok", 
         "message": "서버가 정상적으로 실행 중입니다.",
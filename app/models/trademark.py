@@ -1,5 +1,7 @@
-from sqlalchemy import Column, String, Date, Index, Integer
-from sqlalchemy.ext.declarative import declarative_base
+from typing import List, Optional
+from datetime import date
+from sqlalchemy import String, Date, Index, Integer, Text, Computed
+from sqlalchemy.orm import Mapped, mapped_column
 from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from app.database import Base
 
@@ -8,37 +10,48 @@ class Trademark(Base):
     __tablename__ = "trademarks"
 
     # 기본 필드 - 길이 제한 추가 및 컬럼 타입 최적화
-    id = Column(Integer, primary_key=True, autoincrement=True, index=True)
-    applicationNumber = Column(String(20), index=True, comment="출원 번호")
-    productName = Column(String(255), nullable=True, comment="상표명(한글)")
-    productNameEng = Column(String(255), nullable=True, comment="상표명(영문)")
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True, index=True)
+    applicationNumber: Mapped[Optional[str]] = mapped_column(String(20), index=True, comment="출원 번호")
+    productName: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="상표명(한글)")
+    productNameEng: Mapped[Optional[str]] = mapped_column(String(255), nullable=True, comment="상표명(영문)")
     
     # 날짜 타입으로 변경 - 날짜 검색 및 정렬 효율화
-    applicationDate = Column(Date, nullable=True, index=True, comment="출원일")
-    registerStatus = Column(String(50), nullable=True, index=True, comment="등록 상태")
-    publicationNumber = Column(String(20), nullable=True, comment="공고 번호")
-    publicationDate = Column(Date, nullable=True, comment="공고일")
+    applicationDate: Mapped[Optional[date]] = mapped_column(Date, nullable=True, index=True, comment="출원일")
+    registerStatus: Mapped[Optional[str]] = mapped_column(String(50), nullable=True, index=True, comment="등록 상태")
+    publicationNumber: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="공고 번호")
+    publicationDate: Mapped[Optional[date]] = mapped_column(Date, nullable=True, comment="공고일")
     
     # 배열 타입으로 수정 - 샘플 데이터 구조에 맞춤
     # 날짜도 Date 타입으로 통일 - 일관성 및 쿼리 효율화
-    registrationNumber = Column(ARRAY(String(20)), nullable=True, comment="등록 번호")
-    registrationDate = Column(ARRAY(Date), nullable=True, comment="등록일")
+    registrationNumber: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(20)), nullable=True, comment="등록 번호")
+    registrationDate: Mapped[Optional[List[date]]] = mapped_column(ARRAY(Date), nullable=True, comment="등록일")
     
     # 샘플 데이터에 있는 추가 필드
-    registrationPubNumber = Column(String(20), nullable=True, comment="등록공고 번호")
-    registrationPubDate = Column(Date, nullable=True, comment="등록공고일")
+    registrationPubNumber: Mapped[Optional[str]] = mapped_column(String(20), nullable=True, comment="등록공고 번호")
+    registrationPubDate: Mapped[Optional[date]] = mapped_column(Date, nullable=True, comment="등록공고일")
     
     # 기존 필드 유지 (타입 설명 추가)
-    internationalRegNumbers = Column(ARRAY(String(20)), nullable=True, comment="국제 출원 번호")
-    internationalRegDate = Column(Date, nullable=True, comment="국제출원일")
-    priorityClaimNumList = Column(ARRAY(String(20)), nullable=True, comment="우선권 번호")
-    priorityClaimDateList = Column(ARRAY(Date), nullable=True, comment="우선권 일자")
-    asignProductMainCodeList = Column(ARRAY(String(10)), nullable=True, comment="상품 주 분류 코드")
-    asignProductSubCodeList = Column(ARRAY(String(10)), nullable=True, comment="상품 유사군 코드")
-    viennaCodeList = Column(ARRAY(String(10)), nullable=True, comment="비엔나 코드")
+    internationalRegNumbers: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(20)), nullable=True, comment="국제 출원 번호")
+    internationalRegDate: Mapped[Optional[date]] = mapped_column(Date, nullable=True, comment="국제출원일")
+    priorityClaimNumList: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(20)), nullable=True, comment="우선권 번호")
+    priorityClaimDateList: Mapped[Optional[List[date]]] = mapped_column(ARRAY(Date), nullable=True, comment="우선권 일자")
+    asignProductMainCodeList: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(10)), nullable=True, comment="상품 주 분류 코드")
+    asignProductSubCodeList: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(10)), nullable=True, comment="상품 유사군 코드")
+    viennaCodeList: Mapped[Optional[List[str]]] = mapped_column(ARRAY(String(10)), nullable=True, comment="비엔나 코드")
+    
+    # 아래 검색용 컬럼은 SQL 조건/정렬에만 사용하므로 deferred로 지정
+    # (조회 시 SELECT 목록에서 제외하여 전송/디코딩 비용 절감, 속성 접근 시에만 로드)
     
     # 전문 검색을 위한 tsvector 필드 (트리거로 자동 갱신)
-    search_vector = Column(TSVECTOR, nullable=True, comment="검색 벡터")
+    search_vector: Mapped[Optional[str]] = mapped_column(TSVECTOR, nullable=True, deferred=True, comment="검색 벡터")
+    
+    # 트리그램 유사도 검색을 위한 통합 문자열 (상표명/영문명/출원번호/등록번호, 트리거로 자동 갱신)
+    search_trgm: Mapped[Optional[str]] = mapped_column(Text, nullable=True, deferred=True, comment="트리그램 검색 문자열")
+    
+    # 한글 초성 검색을 위한 상표명 초성 문자열 (extract_korean_initial 함수로 계산되는 생성 컬럼)
+    product_name_initial: Mapped[Optional[str]] = mapped_column(
+        Text, Computed('extract_korean_initial("productName")', persisted=True), deferred=True, comment="상표명 초성"
+    )
 
 # PostgreSQL 인덱스 최적화
 # gin_trgm_ops 연산자 클래스를 명시적으로 지정 (pg_trgm 확장 필요)
@@ -53,6 +66,25 @@ Index('idx_product_name_eng_trgm', Trademark.productNameEng,
 # tsvector 인덱스는 그대로 유지 (이미 올바르게 설정됨)
 Index('idx_search_vector', Trademark.search_vector, postgresql_using='gin')
 
+# 통합 검색 문자열 GiST 인덱스 - 유사도 KNN 정렬(<->>) 및 %>, ILIKE 조건 지원
+Index('idx_search_trgm_gist', Trademark.search_trgm, 
+      postgresql_using='gist', 
+      postgresql_ops={"search_trgm": "gist_trgm_ops"})
+
+# 상표명 초성 트리그램 인덱스 - 초성 검색(LIKE '%ㅅㅇ%') 지원
+Index('idx_trademarks_initial_trgm', Trademark.product_name_initial, 
+      postgresql_using='gin', 
+      postgresql_ops={"product_name_initial": "gin_trgm_ops"})
+
+# 등록 상태 + 날짜 복합 인덱스 - 상태 필터와 날짜 범위 필터(date_type별) 동시 적용 시 인덱스 범위 스캔
+# (status, applicationDate) -> idx_tm_status_appdate
+# (status, publicationDate) -> idx_tm_status_pubdate
+# 상태 필터 없이 날짜만 지정하면 applicationDate 단일 인덱스 또는 순차 스캔 사용
+# registrationDate는 date[] 배열이라 B-tree 범위 스캔이 불가능하므로 복합 인덱스를 두지 않음
+# (등록일 범위 필터는 unnest 기반 EXISTS 조건으로 처리)
+Index('idx_tm_status_appdate', Trademark.registerStatus, Trademark.applicationDate.desc())
+Index('idx_tm_status_pubdate', Trademark.registerStatus, Trademark.publicationDate.desc())
+
 # 배열 필드에 대한 GIN 인덱스 추가 - 다수 필드 검색 지원
 Index('idx_product_main_code_array', Trademark.asignProductMainCodeList, postgresql_using='gin')
 Index('idx_product_sub_code_array', Trademark.asignProductSubCodeList, postgresql_using='gin')
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Optional, TypeVar, Generic, Type, Any
+from typing import List, Tuple, Optional, TypeVar, Generic, Type, Any, Iterator, Iterable
 from sqlalchemy.orm import Session
 
 # 제네릭 타입 변수 정의
@@ -26,6 +26,19 @@ class BaseRepository(Generic[ModelT, ParamsT], ABC):
         """
         pass
     
+    @abstractmethod
+    def find_by_ids(self, ids: List[int]) -> List[ModelT]:
+        """
+        여러 ID의 엔티티를 한 번에 조회
+        
+        Args:
+            ids: 엔티티 ID 목록
+            
+        Returns:
+            조회된 엔티티 리스트 (요청한 ID 순서, 존재하지 않는 ID는 제외)
+        """
+        pass
+    
     @abstractmethod
     def search(self, params: ParamsT) -> Tuple[List[ModelT], int]:
         """
@@ -40,12 +53,12 @@ class BaseRepository(Generic[ModelT, ParamsT], ABC):
         pass
     
     @abstractmethod
-    def list_all(self) -> List[ModelT]:
+    def list_all(self) -> Iterator[ModelT]:
         """
         모든 엔티티 조회
         
         Returns:
-            모든 엔티티 리스트
+            모든 엔티티 이터레이터 (리스트가 필요하면 list()로 변환)
         """
         pass
     
@@ -62,6 +75,19 @@ class BaseRepository(Generic[ModelT, ParamsT], ABC):
         """
         pass
     
+    @abstractmethod
+    def create_many(self, entities: Iterable[ModelT]) -> List[ModelT]:
+        """
+        여러 엔티티를 한 번에 생성 (단일 트랜잭션)
+        
+        Args:
+            entities: 생성할 엔티티 목록
+            
+        Returns:
+            생성된 엔티티 리스트
+        """
+        pass
+    
     @abstractmethod
     def update(self, entity: ModelT) -> ModelT:
         """
@@ -7,6 +7,12 @@ from .mock.trademark_repository import MockTrademarkRepository
 
 RepositoryType = Literal["postgres", "mock"]
 
+# 저장소 타입별 구현체 등록
+_REGISTRY = {
+    "postgres": PostgresTrademarkRepository,
+    "mock": MockTrademarkRepository,
+}
+
 def get_trademark_repository(
     repo_type: RepositoryType = "postgres", 
     db: Session = None
@@ -21,13 +27,13 @@ def get_trademark_repository(
     Returns:
         ITrademarkRepository 구현체
     """
-    if repo_type == "postgres":
-        if db is None:
-            raise ValueError("PostgreSQL 저장소를 사용하려면 db 세션이 필요합니다")
-        return PostgresTrademarkRepository(db)
+    repository_class = _REGISTRY.get(repo_type)
+    if repository_class is None:
+        raise ValueError(f"지원되지 않는 저장소 타입: {repo_type}")
     
-    elif repo_type == "mock":
-        return MockTrademarkRepository()
+    if repository_class is MockTrademarkRepository:
+        return repository_class()
     
-    else:
-        raise ValueError(f"지원되지 않는 저장소 타입: {repo_type}")
\ No newline at end of file
+    if db is None:
+        raise ValueError("PostgreSQL 저장소를 사용하려면 db 세션이 필요합니다")
+    return repository_class(db)
\ No newline at end of file
@@ -1,4 +1,5 @@
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Set, Iterator, Iterable
+from bisect import bisect_right
 import logging
 from ...models.trademark import Trademark
 from ...schemas.trademark import TrademarkSearchParams
@@ -7,6 +8,10 @@ from ..trademark_repository import ITrademarkRepository
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 검색 문자열 구분자 (필드 구분 / 상표 구분)
+_FIELD_SEP = "\x1f"
+_RECORD_SEP = "\x1e"
+
 class MockTrademarkRepository(ITrademarkRepository):
     """
     메모리 기반 Mock 상표 저장소 (테스트용)
@@ -18,6 +23,82 @@ class MockTrademarkRepository(ITrademarkRepository):
         self.trademarks = {}  # 메모리에 상표 저장 
         self.register_statuses = ["등록", "출원", "거절", "실효"]
         self.product_codes = ["01", "02", "03", "05", "35", "42", "43"]
+        
+        # 필터 검색용 역인덱스 (값 -> 상표 ID 집합)
+        self._by_status: Dict[str, Set[int]] = {}
+        self._by_product: Dict[str, Set[int]] = {}
+        # 저장 순서 번호 (ID -> 순번, 필터 검색 결과를 저장 순서로 정렬할 때 사용, update 시에도 유지)
+        self._order: Dict[int, int] = {}
+        self._next_order = 0
+        # 인덱싱 당시의 값 (엔티티가 외부에서 수정된 뒤 update 되어도 이전 값을 제거할 수 있도록 보관)
+        self._indexed: Dict[int, Tuple[Optional[str], Tuple[str, ...]]] = {}
+        # 검색어 매칭용 casefold 문자열 (상표명/영문명/출원번호를 미리 이어붙여 보관)
+        self._haystacks: Dict[int, str] = {}
+        # 전체 대상 검색용 연결 문자열 캐시 (ID 목록, 각 상표 시작 위치, 연결 문자열)
+        self._corpus: Optional[Tuple[List[int], List[int], str]] = None
+    
+    def _index(self, entity: Trademark) -> None:
+        """
+        상표를 역인덱스에 등록
+        """
+        status = entity.registerStatus
+        codes = tuple(entity.asignProductMainCodeList or ())
+        if status:
+            self._by_status.setdefault(status, set()).add(entity.id)
+        for code in codes:
+            self._by_product.setdefault(code, set()).add(entity.id)
+        self._indexed[entity.id] = (status, codes)
+        self._haystacks[entity.id] = _FIELD_SEP.join((
+            entity.productName or "",
+            entity.productNameEng or "",
+            entity.applicationNumber or "",
+        )).casefold()
+        self._corpus = None
+    
+    def _unindex(self, id: int) -> None:
+        """
+        상표를 역인덱스에서 제거
+        """
+        indexed = self._indexed.pop(id, None)
+        if indexed is None:
+            return
+        self._haystacks.pop(id, None)
+        self._corpus = None
+        status, codes = indexed
+        if status:
+            self._by_status.get(status, set()).discard(id)
+        for code in codes:
+            self._by_product.get(code, set()).discard(id)
+    
+    def _get_corpus(self) -> Tuple[List[int], List[int], str]:
+        """
+        전체 상표의 검색 문자열을 하나로 연결한 캐시 반환 (변경 시 재생성)
+        """
+        if self._corpus is None:
+            ids = list(self.trademarks.keys())
+            offsets = []
+            position = 0
+            for id in ids:
+                offsets.append(position)
+                position += len(self._haystacks[id]) + 1
+            self._corpus = (ids, offsets, _RECORD_SEP.join(self._haystacks[id] for id in ids))
+        return self._corpus
+    
+    def _find_all(self, query_folded: str) -> List[int]:
+        """
+        연결 문자열에서 str.find를 반복 호출하여 검색어가 포함된 상표 ID 목록 반환
+        """
+        ids, offsets, corpus = self._get_corpus()
+        matched_ids = []
+        position = corpus.find(query_folded)
+        while position >= 0:
+            idx = bisect_right(offsets, position) - 1
+            matched_ids.append(ids[idx])
+            # 같은 상표에서 중복 매칭되지 않도록 다음 상표 시작 위치부터 탐색
+            if idx + 1 >= len(offsets):
+                break
+            position = corpus.find(query_folded, offsets[idx + 1])
+        return matched_ids
     
     def find_by_id(self, id: int) -> Optional[Trademark]:
         """
@@ -25,59 +106,62 @@ class MockTrademarkRepository(ITrademarkRepository):
         """
         return self.trademarks.get(id)
     
+    def find_by_ids(self, ids: List[int]) -> List[Trademark]:
+        """
+        여러 ID로 상표 조회
+        """
+        trademarks = self.trademarks
+        return [trademarks[id] for id in dict.fromkeys(ids) if id in trademarks]
+    
     def search(self, params: TrademarkSearchParams) -> Tuple[List[Trademark], int]:
         """
         검색 조건에 맞는 상표 검색
-        """
-        # 모든 상표 가져오기
-        all_trademarks = list(self.trademarks.values())
         
-        # 검색 조건 적용
-        filtered_trademarks = []
-        for trademark in all_trademarks:
-            # 상태 필터
-            if params.status and trademark.registerStatus != params.status:
-                continue
-            
-            # 상품 코드 필터
-            if params.product_code and (
-                not trademark.asignProductMainCodeList or 
-                params.product_code not in trademark.asignProductMainCodeList
-            ):
-                continue
-            
-            # 검색어 필터
-            if params.query:
-                query_lower = params.query.lower()
-                product_name = trademark.productName or ""
-                product_name_eng = trademark.productNameEng or ""
-                application_number = trademark.applicationNumber or ""
-                
-                if (
-                    query_lower not in product_name.lower() and
-                    query_lower not in product_name_eng.lower() and
-                    query_lower not in application_number.lower()
-                ):
-                    continue
-            
-            # 모든 필터 통과
-            filtered_trademarks.append(trademark)
+        상태/상품 코드 필터는 역인덱스 교집합으로 후보를 좁히고, 검색어는 후보에 대해서만 확인
+        """
+        # 필터 조건에 맞는 후보 ID 계산 (필터가 없으면 전체)
+        candidates = None
+        if params.status:
+            candidates = self._by_status.get(params.status, set())
+        if params.product_code:
+            product_ids = self._by_product.get(params.product_code, set())
+            candidates = product_ids if candidates is None else candidates & product_ids
+        # 필터 유무와 관계없이 결과 순서는 저장(삽입) 순서로 통일
+        # (후보만 저장 순번으로 정렬하므로 전체 상표 수가 아닌 후보 수에 비례)
+        if candidates is None:
+            candidate_ids = self.trademarks.keys()
+        else:
+            candidate_ids = sorted(candidates, key=self._order.__getitem__)
+        
+        # 검색어 필터
+        if params.query:
+            query_folded = params.query.casefold()
+            if candidates is None and _FIELD_SEP not in query_folded and _RECORD_SEP not in query_folded:
+                # 필터가 없으면 연결 문자열 전체를 한 번에 탐색
+                matched_ids = self._find_all(query_folded)
+            else:
+                haystacks = self._haystacks
+                matched_ids = [id for id in candidate_ids if query_folded in haystacks[id]]
+        else:
+            matched_ids = list(candidate_ids)
         
         # 총 결과 수
-        total_count = len(filtered_trademarks)
+        total_count = len(matched_ids)
         
-        # 페이징 적용
+        # 페이징 적용 (요청한 페이지의 ID만 상표 객체로 변환)
         start = params.offset
         end = start + params.limit
-        paged_trademarks = filtered_trademarks[start:end]
+        trademarks = self.trademarks
+        paged_trademarks = [trademarks[id] for id in matched_ids[start:end]]
         
         return paged_trademarks, total_count
     
-    def list_all(self) -> List[Trademark]:
+    def list_all(self) -> Iterator[Trademark]:
         """
         모든 상표 조회
         """
-        return list(self.trademarks.values())
+        # 순회 중 저장소가 변경되어도 안전하도록 스냅샷을 순회
+        yield from list(self.trademarks.values())
     
     def create(self, entity: Trademark) -> Trademark:
         """
@@ -93,8 +177,17 @@ class MockTrademarkRepository(ITrademarkRepository):
         
         # 상표 저장
         self.trademarks[entity.id] = entity
+        self._order[entity.id] = self._next_order
+        self._next_order += 1
+        self._index(entity)
         return entity
     
+    def create_many(self, entities: Iterable[Trademark]) -> List[Trademark]:
+        """
+        여러 상표 일괄 생성
+        """
+        return [self.create(entity) for entity in entities]
+    
     def update(self, entity: Trademark) -> Trademark:
         """
         상표 업데이트
@@ -107,8 +200,10 @@ class MockTrademarkRepository(ITrademarkRepository):
         if entity.id not in self.trademarks:
             raise ValueError(f"id '{entity.id}'을(를) 찾을 수 없습니다")
         
-        # 상표 업데이트
+        # 상표 업데이트 (이전 인덱스 값 제거 후 재등록)
+        self._unindex(entity.id)
         self.trademarks[entity.id] = entity
+        self._index(entity)
         return entity
     
     def delete(self, id: int) -> bool:
@@ -117,6 +212,8 @@ class MockTrademarkRepository(ITrademarkRepository):
         """
         if id in self.trademarks:
             del self.trademarks[id]
+            del self._order[id]
+            self._unindex(id)
             return True
         return False
     
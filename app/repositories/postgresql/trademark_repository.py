@@ -1,18 +1,111 @@
-from typing import List, Tuple, Optional, Dict, Any
+from typing import List, Tuple, Optional, Dict, Any, Iterator, Iterable, FrozenSet
+from functools import lru_cache
 import logging
 import datetime
-from sqlalchemy import select, func, or_, and_, text, cast, String, insert
-from sqlalchemy.sql.expression import literal_column
+import time
+from sqlalchemy import select, func, or_, text, bindparam, String, delete as sql_delete
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 
+from ...config import get_settings
 from ...models.trademark import Trademark
-from ...schemas.trademark import TrademarkSearchParams
+from ...schemas.trademark import TrademarkSearchParams, DateFieldType
+from ...utils.dates import parse_yyyymmdd
 from ..trademark_repository import ITrademarkRepository
-from ...utils.search import is_korean, matches_initial_consonants, extract_initial_consonants
 
 # 로깅 설정
 logger = logging.getLogger(__name__)
 
+# 한글 초성 문자 집합 및 초성 제거용 변환 테이블 (초성 검색어 판별용)
+_HANGUL_INITIALS = frozenset("ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ")
+_INITIAL_DELETE_TABLE = str.maketrans("", "", "".join(_HANGUL_INITIALS))
+
+# tsquery 문법 문자 (사용자 입력에 포함되면 to_tsquery 구문 오류 발생, SQL의 regexp_replace에서 공백으로 치환)
+_TSQUERY_SPECIAL_PATTERN = r"[&|!():*<>'\\]"
+
+# 날짜 필터 대상 컬럼 화이트리스트
+# (applicationDate/publicationDate는 registerStatus와의 복합 인덱스가 존재, registrationDate는 date[] 배열 컬럼)
+_DATE_COLUMNS = {
+    DateFieldType.APPLICATION_DATE: Trademark.applicationDate,
+    DateFieldType.REGISTRATION_DATE: Trademark.registrationDate,
+    DateFieldType.PUBLICATION_DATE: Trademark.publicationDate,
+}
+
+# 배열(date[]) 컬럼인 날짜 필드 - 원소 중 하나라도 범위에 들면 일치 (date[]와 date 간 비교 연산자는 없음)
+_ARRAY_DATE_FIELDS = frozenset({DateFieldType.REGISTRATION_DATE})
+
+def _parse_yyyymmdd(value: str) -> Optional[datetime.date]:
+    """
+    YYYYMMDD 문자열을 날짜로 변환 (형식이 맞지 않거나 존재하지 않는 날짜면 None)
+    """
+    try:
+        return parse_yyyymmdd(value)
+    except ValueError:
+        return None
+
+# 퍼지 검색(%>) 단어 유사도 임계값 - 트랜잭션 범위로 지정 (pg_trgm 기본값 0.6은 기존 similarity > 0.3 기준보다 엄격)
+SEARCH_SIMILARITY_THRESHOLD = get_settings().SEARCH_SIMILARITY_THRESHOLD
+_SET_SIMILARITY_THRESHOLD = text("SELECT set_config('pg_trgm.word_similarity_threshold', :threshold, true)")
+
+# 등록 상태/상품 코드 목록 캐시 (전체 테이블 스캔 결과를 일정 시간 재사용, 데이터 변경 시 무효화)
+LOOKUP_CACHE_TTL = get_settings().LOOKUP_CACHE_TTL  # 초
+_lookup_cache: Dict[str, Tuple[float, List[str]]] = {}
+
+def _get_cached_lookup(key: str) -> Optional[List[str]]:
+    """유효한 캐시 항목이 있으면 복사본 반환, 없거나 만료되면 None"""
+    entry = _lookup_cache.get(key)
+    if entry is None or time.monotonic() - entry[0] >= LOOKUP_CACHE_TTL:
+        return None
+    return list(entry[1])
+
+def _set_cached_lookup(key: str, values: List[str]) -> None:
+    """캐시 항목 저장"""
+    _lookup_cache[key] = (time.monotonic(), list(values))
+
+def _invalidate_lookup_cache() -> None:
+    """상표 데이터 변경 시 목록 캐시 무효화"""
+    _lookup_cache.clear()
+
+@lru_cache(maxsize=8)
+def _upsert_statement(columns: FrozenSet[str]):
+    """
+    id 충돌 시 입력된 컬럼만 갱신하는 upsert 구문 (컬럼 조합별로 한 번만 생성하여 재사용)
+    """
+    stmt = pg_insert(Trademark)
+    return stmt.on_conflict_do_update(
+        index_elements=['id'],
+        set_={name: stmt.excluded[name] for name in sorted(columns) if name != 'id'}
+    )
+
+# COPY 적재 대상 컬럼 (트리거/생성 컬럼으로 채워지는 검색용 컬럼 제외)
+_COPY_COLUMNS = tuple(
+    column.name for column in Trademark.__table__.columns
+    if column.computed is None and column.name not in ('search_vector', 'search_trgm')
+)
+_COPY_COLUMN_SET = frozenset(_COPY_COLUMNS)
+_COPY_COLUMNS_SQL = ", ".join(f'"{name}"' for name in _COPY_COLUMNS)
+
+# 세션별 임시 스테이징 테이블 (적재 대상 컬럼만 복사, 커밋 시 행 자동 삭제)
+_STAGE_TABLE_DDL = (
+    "CREATE TEMP TABLE IF NOT EXISTS trademarks_stage ON COMMIT DELETE ROWS AS "
+    f"SELECT {_COPY_COLUMNS_SQL} FROM trademarks WITH NO DATA"
+)
+_STAGE_TRUNCATE_SQL = "TRUNCATE trademarks_stage"
+
+@lru_cache(maxsize=8)
+def _copy_statements(columns: Tuple[str, ...]) -> Tuple[str, str]:
+    """
+    컬럼 조합별 COPY 및 upsert 구문 (id 충돌 시 입력된 컬럼만 갱신, _upsert_statement와 동일)
+    """
+    columns_sql = ", ".join(f'"{name}"' for name in columns)
+    updates = ", ".join(f'"{name}" = EXCLUDED."{name}"' for name in columns if name != 'id')
+    copy_sql = f"COPY trademarks_stage ({columns_sql}) FROM STDIN"
+    upsert_sql = (
+        f"INSERT INTO trademarks ({columns_sql}) SELECT {columns_sql} FROM trademarks_stage "
+        + (f"ON CONFLICT (id) DO UPDATE SET {updates}" if updates else "ON CONFLICT (id) DO NOTHING")
+    )
+    return copy_sql, upsert_sql
+
 class PostgresTrademarkRepository(ITrademarkRepository):
     """
     PostgreSQL 기반 상표 저장소 구현체
@@ -41,6 +134,27 @@ class PostgresTrademarkRepository(ITrademarkRepository):
             logger.error(f"상표 ID 조회 중 오류: {str(e)}")
             raise
     
+    def find_by_ids(self, ids: List[int]) -> List[Trademark]:
+        """
+        여러 ID로 상표 정보 조회 (IN 조건 단일 쿼리)
+        
+        Args:
+            ids: 상표 ID 목록
+            
+        Returns:
+            상표 모델 객체 리스트 (요청한 ID 순서, 존재하지 않는 ID는 제외)
+        """
+        unique_ids = list(dict.fromkeys(ids))
+        if not unique_ids:
+            return []
+        try:
+            query = select(Trademark).where(Trademark.id.in_(unique_ids))
+            found = {trademark.id: trademark for trademark in self.db.execute(query).scalars()}
+            return [found[id] for id in unique_ids if id in found]
+        except Exception as e:
+            logger.error(f"상표 ID 목록 조회 중 오류: {str(e)}")
+            raise
+    
     def search(self, params: TrademarkSearchParams) -> Tuple[List[Trademark], int]:
         """
         검색 조건에 맞는 상표 정보 검색
@@ -58,52 +172,34 @@ class PostgresTrademarkRepository(ITrademarkRepository):
             # 필터 조건 적용
             query = self._apply_filters(query, params)
             
-            # 검색어가 있는 경우 검색 조건 적용
-            initial_search_term = None
+            # 검색어가 있는 경우 검색 조건 및 유사도 정렬 적용
+            # 필터만 있는 경우 유사도 계산 없이 출원일 역순 정렬 (상태+출원일 복합 인덱스 활용)
             if params.query:
+                # %> 연산자가 사용할 임계값을 바인드 파라미터로 지정 (현재 트랜잭션에만 적용)
+                self.db.execute(_SET_SIMILARITY_THRESHOLD, {"threshold": str(SEARCH_SIMILARITY_THRESHOLD)})
                 query = self._apply_search_conditions(query, params.query)
-                # 초성 검색 여부 확인
-                if hasattr(query, '_initial_search_term'):
-                    initial_search_term = getattr(query, '_initial_search_term')
-                    delattr(query, '_initial_search_term')
+                return self._search_page_then_count(query, params)
             
-            # 총 결과 수 계산을 위한 카운트 쿼리 (초성 검색이면 나중에 수정)
-            count_query = query.with_only_columns(func.count()).order_by(None)
+            query = query.order_by(Trademark.applicationDate.desc(), Trademark.id.asc())
             
-            # 결과 조회
-            results = self.db.execute(query).scalars().all()
+            # 페이징 조회와 총 결과 수 계산을 한 번의 쿼리로 처리 (COUNT(*) OVER() 윈도우 함수)
+            paged_query = (
+                query.add_columns(func.count().over().label('total_count'))
+                .offset(params.offset)
+                .limit(params.limit)
+            )
+            rows = self.db.execute(paged_query).all()
             
-            # 초성 검색인 경우 Python에서 필터링
-            if initial_search_term:
-                from ...utils.search import matches_initial_consonants, extract_initial_consonants
-                # 초성 검색 필터링 - 로깅 추가
-                filtered_results = []
-                logger.debug(f"초성 검색 필터링 시작: 검색어='{initial_search_term}', 결과 수={len(results)}")
-                
-                for trademark in results:
-                    # productName이 있고 초성과 일치하는지 확인
-                    product_name = trademark.productName or ""
-                    if product_name and initial_search_term in extract_initial_consonants(product_name):
-                        filtered_results.append(trademark)
-                        if len(filtered_results) <= 5:  # 처음 5개만 로깅
-                            logger.debug(f"초성 일치: 상표명='{product_name}', 초성='{extract_initial_consonants(product_name)}'")
-                
-                # 필터링된 결과로 대체
-                logger.debug(f"초성 검색 필터링 완료: 검색어='{initial_search_term}', 필터링 전={len(results)}, 필터링 후={len(filtered_results)}")
-                results = filtered_results
-                total_count = len(results)
-                
-                # 페이징 적용 (Python에서)
-                start = params.offset
-                end = start + params.limit
-                results = results[start:end]
+            if rows:
+                total_count = rows[0].total_count
+                results = [row[0] for row in rows]
+            elif params.offset > 0:
+                # 오프셋이 결과 범위를 벗어난 경우 윈도우 값을 얻을 수 없으므로 별도 카운트
+                total_count = self._count(query)
+                results = []
             else:
-                # 기본 페이징 및 카운트
-                total_count = self.db.execute(count_query).scalar()
-                
-                # 페이징 적용
-                query = query.offset(params.offset).limit(params.limit)
-                results = self.db.execute(query).scalars().all()
+                total_count = 0
+                results = []
             
             return results, total_count
         
@@ -111,17 +207,42 @@ class PostgresTrademarkRepository(ITrademarkRepository):
             logger.error(f"상표 검색 중 오류: {str(e)}")
             raise
     
-    def list_all(self) -> List[Trademark]:
+    def _count(self, query) -> int:
+        """정렬을 제거한 검색 쿼리의 총 결과 수"""
+        return self.db.execute(query.with_only_columns(func.count()).order_by(None)).scalar()
+    
+    def _search_page_then_count(self, query, params: TrademarkSearchParams) -> Tuple[List[Trademark], int]:
         """
-        모든 상표 조회 (주의: 대량 데이터의 경우 사용 지양)
+        검색어 쿼리의 페이지를 먼저 조회한 뒤 필요한 경우에만 별도 카운트
         
+        COUNT(*) OVER()는 첫 행을 반환하기 전에 조건에 맞는 모든 행을 읽어야 하므로
+        인덱스 순서 정렬(KNN)이 LIMIT에서 조기 종료할 수 없게 됨
+        
+        Args:
+            query: 검색 조건과 정렬이 적용된 쿼리
+            params: 검색 파라미터
+            
         Returns:
-            모든 상표 리스트
+            상표 모델 객체 리스트와 총 결과 수
+        """
+        results = list(self.db.execute(query.offset(params.offset).limit(params.limit)).scalars())
+        
+        # 마지막 페이지(결과가 limit 미만)이면 총 결과 수를 바로 알 수 있음
+        if 0 < len(results) < params.limit or (not results and params.offset == 0):
+            return results, params.offset + len(results)
+        return results, self._count(query)
+    
+    def list_all(self) -> Iterator[Trademark]:
+        """
+        모든 상표 조회 (서버 사이드 커서로 1000건씩 스트리밍)
+        
+        Returns:
+            모든 상표 이터레이터
         """
         try:
-            query = select(Trademark)
-            results = self.db.execute(query).scalars().all()
-            return list(results)
+            query = select(Trademark).execution_options(yield_per=1000, stream_results=True)
+            result = self.db.execute(query)
+            yield from result.scalars()
         except Exception as e:
             logger.error(f"모든 상표 조회 중 오류: {str(e)}")
             raise
@@ -139,6 +260,7 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         try:
             self.db.add(entity)
             self.db.commit()
+            _invalidate_lookup_cache()
             self.db.refresh(entity)
             return entity
         except Exception as e:
@@ -146,6 +268,32 @@ class PostgresTrademarkRepository(ITrademarkRepository):
             logger.error(f"상표 생성 중 오류: {str(e)}")
             raise
     
+    def create_many(self, entities: Iterable[Trademark]) -> List[Trademark]:
+        """
+        여러 상표 일괄 생성
+        
+        한 번의 flush로 INSERT를 묶어 실행하고(insertmanyvalues) 한 번만 커밋
+        행마다 커밋/refresh 하던 create() 반복 대비 왕복 및 fsync 횟수 감소
+        
+        Args:
+            entities: 생성할 상표 엔티티 목록
+            
+        Returns:
+            생성된 상표 엔티티 리스트 (ID 할당됨)
+        """
+        entities = list(entities)
+        if not entities:
+            return []
+        try:
+            self.db.add_all(entities)
+            self.db.commit()
+            _invalidate_lookup_cache()
+            return entities
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"상표 일괄 생성 중 오류: {str(e)}")
+            raise
+    
     def update(self, entity: Trademark) -> Trademark:
         """
         상표 업데이트
@@ -159,6 +307,7 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         try:
             self.db.merge(entity)
             self.db.commit()
+            _invalidate_lookup_cache()
             self.db.refresh(entity)
             return entity
         except Exception as e:
@@ -177,12 +326,14 @@ class PostgresTrademarkRepository(ITrademarkRepository):
             삭제 성공 여부
         """
         try:
-            entity = self.find_by_id(id)
-            if entity:
-                self.db.delete(entity)
-                self.db.commit()
-                return True
-            return False
+            # 조회 후 삭제 대신 DELETE ... RETURNING 한 번으로 처리 (왕복 1회)
+            stmt = sql_delete(Trademark).where(Trademark.id == id).returning(Trademark.id)
+            row = self.db.execute(stmt).first()
+            self.db.commit()
+            if row is None:
+                return False
+            _invalidate_lookup_cache()
+            return True
         except Exception as e:
             self.db.rollback()
             logger.error(f"상표 삭제 중 오류: {str(e)}")
@@ -195,10 +346,15 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         Returns:
             중복 제거된 등록 상태 목록
         """
+        cached = _get_cached_lookup("register_statuses")
+        if cached is not None:
+            return cached
         try:
             query = select(Trademark.registerStatus).distinct().where(Trademark.registerStatus != None)
             results = self.db.execute(query).scalars().all()
-            return [status for status in results if status]
+            statuses = [status for status in results if status]
+            _set_cached_lookup("register_statuses", statuses)
+            return statuses
         except Exception as e:
             logger.error(f"등록 상태 목록 조회 중 오류: {str(e)}")
             raise
@@ -210,11 +366,16 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         Returns:
             중복 제거된 상품 분류 코드 목록
         """
+        cached = _get_cached_lookup("product_codes")
+        if cached is not None:
+            return cached
         try:
             # PostgreSQL의 unnest 함수를 사용하여 배열 요소를 행으로 변환 후 중복 제거
             query = text('SELECT DISTINCT unnest("asignProductMainCodeList") as code FROM trademarks WHERE "asignProductMainCodeList" IS NOT NULL ORDER BY code')
             results = self.db.execute(query).scalars().all()
-            return [code for code in results if code]
+            codes = [code for code in results if code]
+            _set_cached_lookup("product_codes", codes)
+            return codes
         except Exception as e:
             logger.error(f"상품 분류 코드 목록 조회 중 오류: {str(e)}")
             raise
@@ -241,30 +402,39 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         
         # 날짜 범위 필터 - Date 타입 처리 개선
         if params.from_date or params.to_date:
-            date_column = getattr(Trademark, params.date_type)
+            # getattr 대신 화이트리스트 매핑 사용 (임의 속성 접근 방지)
+            date_column = _DATE_COLUMNS.get(params.date_type)
+            if date_column is None:
+                raise ValueError(f"지원하지 않는 날짜 필드: {params.date_type}")
             
             # 날짜 형식 변환 (문자열 -> 날짜)
+            from_date = to_date = None
             if params.from_date:
-                try:
-                    from_date = datetime.date(
-                        year=int(params.from_date[:4]),
-                        month=int(params.from_date[4:6]),
-                        day=int(params.from_date[6:8])
-                    )
-                    query = query.where(date_column >= from_date)
-                except (ValueError, TypeError, IndexError):
-                    logger.warning(f"잘못된 시작 날짜 형식: {params.from_date}")
+                from_date = _parse_yyyymmdd(params.from_date)
+                if from_date is None:
+                    logger.warning("잘못된 시작 날짜 형식: %s", params.from_date)
             
             if params.to_date:
-                try:
-                    to_date = datetime.date(
-                        year=int(params.to_date[:4]),
-                        month=int(params.to_date[4:6]),
-                        day=int(params.to_date[6:8])
-                    )
+                to_date = _parse_yyyymmdd(params.to_date)
+                if to_date is None:
+                    logger.warning("잘못된 종료 날짜 형식: %s", params.to_date)
+            
+            if params.date_type in _ARRAY_DATE_FIELDS:
+                # 배열 원소를 펼쳐서 같은 원소가 시작/종료 조건을 모두 만족하는지 확인
+                # EXISTS (SELECT 1 FROM unnest("registrationDate") d WHERE d >= :from AND d <= :to)
+                element = func.unnest(date_column).column_valued("date_element")
+                bounds = []
+                if from_date is not None:
+                    bounds.append(element >= from_date)
+                if to_date is not None:
+                    bounds.append(element <= to_date)
+                if bounds:
+                    query = query.where(select(element).where(*bounds).exists())
+            else:
+                if from_date is not None:
+                    query = query.where(date_column >= from_date)
+                if to_date is not None:
                     query = query.where(date_column <= to_date)
-                except (ValueError, TypeError, IndexError):
-                    logger.warning(f"잘못된 종료 날짜 형식: {params.to_date}")
         
         return query
     
@@ -283,101 +453,140 @@ class PostgresTrademarkRepository(ITrademarkRepository):
         # 검색어 준비
         search_term = search_term.strip()
         
-        # 한글 초성 검색인지 확인
-        is_initial_search = matches_initial_consonants(search_term, search_term)
+        # 한글 초성 검색인지 확인 (초성을 모두 제거했을 때 남는 문자가 없으면 초성 검색)
+        is_initial_search = bool(search_term) and not search_term.translate(_INITIAL_DELETE_TABLE)
+        
+        # 검색어/LIKE 패턴을 이름 있는 바인드 파라미터로 한 번만 생성하여 모든 조건과 정렬에서 재사용
+        # (조건마다 익명 파라미터가 늘어나지 않아 컴파일 캐시 키와 준비된 구문이 검색어와 무관하게 동일)
+        # 타입을 명시하지 않으면 ASCII 여부에 따라 String/Unicode로 추론되어 캐시 항목이 나뉘므로 String으로 고정
+        term_param = bindparam('search_term', search_term, type_=String())
+        like_param = bindparam('search_like', f"%{search_term}%", type_=String())
         
         if is_initial_search:
-            logger.debug(f"한글 초성 검색 패턴 감지: {search_term}")
-            # 한글 초성 검색 - Python 구현 함수 활용 (데이터베이스 함수 사용 안함)
-            try:
-                # 기본 필터링을 최소화하고 모든 결과를 가져온 다음 Python에서 필터링합니다
-                # 초성 검색을 위한 플래그 설정
-                setattr(query, '_initial_search_term', search_term)
-                
-                # 검색어가 하나 이상일 경우, 첫 글자로만 약간의 필터링 수행
-                if len(search_term) > 1:
-                    # 약한 필터링 - DB에서 필터링을 최소화하고 Python에서 정확히 필터링
-                    search_condition = Trademark.id > 0  # 항상 True 조건
-                    query = query.where(search_condition)
-                    logger.debug(f"한글 초성 검색을 위한 최소 필터 적용: {search_term}")
-                else:
-                    # 검색어가 한 글자인 경우 필터링 없이 진행
-                    logger.debug(f"한글 초성 검색 - 필터 없이 전체 데이터 대상 검색: {search_term}")
-            except Exception as e:
-                logger.warning(f"한글 초성 검색 필터 설정 실패, 일반 검색으로 대체: {str(e)}")
-                # 실패시 일반 검색으로 대체
-                search_condition = or_(
-                    Trademark.productName.ilike(f"%{search_term}%"),
-                    Trademark.productNameEng.ilike(f"%{search_term}%"),
-                    Trademark.applicationNumber.ilike(f"%{search_term}%")
-                )
-                query = query.where(search_condition)
+            logger.debug("한글 초성 검색 패턴 감지: %s", search_term)
+            # 한글 초성 검색 - 생성 컬럼(product_name_initial)의 트리그램 인덱스 활용
+            # 검색어는 바인드 파라미터로 전달되어 SQL 인젝션 위험이 없고 준비된 구문 계획도 재사용됨
+            query = query.where(Trademark.product_name_initial.like(like_param))
+            query = query.order_by(Trademark.product_name_initial.op('<->')(term_param).asc())
         else:
-            # 한글 검색인지 확인 - is_korean 함수 활용하여 가독성 개선
-            has_korean = is_korean(search_term)
-            logger.debug(f"검색어 분석: 한글포함={has_korean}, 검색어='{search_term}'")
+            logger.debug("일반 검색: %s", search_term)
             
             # 일반 검색 - 트리그램 유사도 활용
             
-            # 1. tsvector 기반 전문 검색
-            # 검색어를 토큰화하고 각 토큰에 :* 접미사 추가 (접두사 검색)
-            tsquery_tokens = [f"{token}:*" for token in search_term.split()]
-            tsquery_text = " & ".join(tsquery_tokens)
-            tsquery = func.to_tsquery('simple', tsquery_text)
-            
             # 2. 트리그램 유사도 기반 퍼지 검색
-            # similarity 함수가 0.3 이상이면 유사하다고 판단
-            similarity_threshold = 0.3
-            similarity_conditions = [
-                func.similarity(Trademark.productName, search_term) > similarity_threshold,
-                func.similarity(Trademark.productNameEng, search_term) > similarity_threshold,
-                Trademark.applicationNumber.ilike(f"%{search_term}%"),
-                # 배열 필드 검색을 위한 조건
-                func.array_to_string(Trademark.registrationNumber, ',').ilike(f"%{search_term}%")
+            # search_trgm(상표명/영문명/출원번호/등록번호 통합 컬럼)에 대해 단어 유사도(%>) 및 부분 일치 검사
+            # 두 조건 모두 GiST(gist_trgm_ops) 인덱스를 사용하며, %> 임계값은 search()에서 지정한
+            # pg_trgm.word_similarity_threshold(SEARCH_SIMILARITY_THRESHOLD)를 따름
+            conditions = [
+                Trademark.search_trgm.op('%>')(term_param),
+                Trademark.search_trgm.ilike(like_param)
             ]
             
-            # 검색 조건 적용
-            search_condition = or_(
-                Trademark.search_vector.op('@@')(tsquery),
-                *similarity_conditions
-            )
+            # 1. tsvector 기반 전문 검색
+            # tsquery 문법 문자를 공백으로 치환하고 공백 단위로 나눈 각 토큰에 :* 접미사 추가 (접두사 검색)
+            # 토큰 조립을 SQL 식으로 처리하여 검색어와 무관하게 동일한 구문 사용
+            # 남는 토큰이 없으면 nullif로 NULL이 되어 전문 검색 조건은 매칭되지 않음
+            tsquery_text = func.nullif(
+                func.array_to_string(
+                    func.regexp_split_to_array(
+                        func.btrim(func.regexp_replace(term_param, _TSQUERY_SPECIAL_PATTERN, ' ', 'g')),
+                        r'\s+'
+                    ),
+                    ':* & '
+                ),
+                ''
+            ).concat(':*')
+            tsquery = func.to_tsquery('simple', tsquery_text)
+            conditions.insert(0, Trademark.search_vector.op('@@')(tsquery))
+            
+            search_condition = or_(*conditions)
             
             query = query.where(search_condition)
             
-            # 유사도 기반 정렬
-            similarity_order = (
-                func.greatest(
-                    func.similarity(Trademark.productName, search_term),
-                    func.similarity(Trademark.productNameEng, search_term),
-                    func.similarity(cast(Trademark.applicationNumber, String), search_term),
-                    # 배열에서는 첫 번째 요소만 비교 (단순화)
-                    func.coalesce(func.similarity(func.array_to_string(Trademark.registrationNumber, ','), search_term), 0)
-                ).desc()
-            )
+            # 유사도 기반 정렬 - 단어 유사도 거리(<->>)
+            # GiST 인덱스로 KNN 순서 조회가 가능하면 페이지 쿼리는 offset+limit 행에서 멈출 수 있지만,
+            # OR 조건(전문 검색 포함)으로 비트맵 스캔이 선택되면 일치 행 전체를 정렬하며 총 결과 수 카운트는 항상 일치 행 전체를 읽음
+            similarity_order = Trademark.search_trgm.op('<->>')(term_param).asc()
             
             query = query.order_by(similarity_order)
         
         return query
 
-    def batch_insert(self, batch: List[Dict[str, Any]], batch_size: int):
+    def batch_insert(self, batch: List[Dict[str, Any]]) -> int:
         """
-        Batch insert 작업을 수행합니다.
+        상표 데이터 배치를 upsert (여러 행을 하나의 INSERT ... ON CONFLICT 구문으로 실행)
+        
+        배치 크기 조절은 호출자가 담당
         
         Args:
-            batch: 삽입할 데이터 배치
-            batch_size: 배치 크기
+            batch: 삽입할 데이터 배치 (모든 행이 같은 키를 가져야 함)
+            
+        Returns:
+            처리한 행 수
         """
+        if not batch:
+            return 0
         try:
-            # 배치 크기에 도달하면 데이터베이스에 삽입
-            if len(batch) >= batch_size:
-                # upsert 작업 (on conflict do update)
-                self.db.execute(insert(Trademark).values(batch).on_conflict_do_update(
-                    index_elements=['id'],
-                    set_={k: insert(Trademark).excluded[k] for k in batch[0].keys() if k != 'id'}
-                ))
-                self.db.commit()
-                logger.info(f"{len(batch)}개 데이터 처리 완료")
-                batch = []
+            # 행 목록을 파라미터로 전달 (executemany -> insertmanyvalues로 다중 VALUES 배치 실행)
+            self.db.execute(_upsert_statement(frozenset(batch[0])), batch)
+            self.db.commit()
+            _invalidate_lookup_cache()
+            logger.info(f"{len(batch)}개 데이터 처리 완료")
+            return len(batch)
         except Exception as e:
+            self.db.rollback()
             logger.error(f"Batch insert 중 오류: {str(e)}")
+            raise
+
+    def copy_insert(self, rows: Iterable[Dict[str, Any]]) -> int:
+        """
+        상표 데이터를 COPY로 스테이징 테이블에 적재한 뒤 한 번에 upsert
+        
+        행마다 파라미터를 바인딩하는 batch_insert보다 대량 적재에 유리함.
+        batch_insert와 같이 기존 행은 입력된 컬럼만 갱신되며,
+        키 조합이 다른 행은 조합별로 나누어 적재
+        
+        Args:
+            rows: 삽입할 데이터 (id 필수)
+            
+        Returns:
+            처리한 행 수
+            
+        Raises:
+            ValueError: 적재할 수 없는 컬럼(알 수 없는 키, 검색/생성 컬럼)이 포함된 경우
+        """
+        # 키 조합별로 행 값 묶기 (대부분의 배치는 조합이 하나)
+        groups: Dict[Tuple[str, ...], List[tuple]] = {}
+        for row in rows:
+            unknown = row.keys() - _COPY_COLUMN_SET
+            if unknown:
+                raise ValueError(f"적재할 수 없는 컬럼: {', '.join(sorted(unknown))}")
+            columns = tuple(name for name in _COPY_COLUMNS if name in row)
+            groups.setdefault(columns, []).append(tuple(row[name] for name in columns))
+        if not groups:
+            return 0
+        
+        count = 0
+        try:
+            # 세션이 사용하는 psycopg 연결을 그대로 사용 (같은 트랜잭션)
+            raw_connection = self.db.connection().connection.driver_connection
+            with raw_connection.cursor() as cursor:
+                cursor.execute(_STAGE_TABLE_DDL)
+                for index, (columns, values) in enumerate(groups.items()):
+                    if index:
+                        # 이전 조합의 행이 다음 upsert에 다시 포함되지 않도록 비움
+                        cursor.execute(_STAGE_TRUNCATE_SQL)
+                    copy_sql, upsert_sql = _copy_statements(columns)
+                    with cursor.copy(copy_sql) as copy:
+                        for value in values:
+                            copy.write_row(value)
+                    cursor.execute(upsert_sql)
+                    count += len(values)
+            self.db.commit()
+            _invalidate_lookup_cache()
+            logger.info(f"{count}개 데이터 COPY 적재 완료")
+            return count
+        except Exception as e:
+            self.db.rollback()
+            logger.error(f"COPY 적재 중 오류: {str(e)}")
             raise
\ No newline at end of file
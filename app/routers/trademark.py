@@ -1,7 +1,10 @@
-from fastapi import APIRouter, Depends, Query, HTTPException, status
+from fastapi import APIRouter, Body, Depends, Query, HTTPException, Response, status
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel
 from typing import List, Optional, Annotated
 import logging
 
+from ..config import get_settings
 from ..dependencies import TrademarkServiceDep
 from ..schemas.trademark import (
     TrademarkSearchResponse,
@@ -12,14 +15,32 @@ from ..schemas.trademark import (
 # 로거 설정
 logger = logging.getLogger(__name__)
 
+# 메타 목록 응답의 클라이언트/프록시 캐시 헤더 (서버 조회 캐시와 같은 TTL 사용)
+_META_CACHE_CONTROL = f"public, max-age={get_settings().LOOKUP_CACHE_TTL}"
+
 router = APIRouter(
     prefix="/trademarks",
     tags=["trademarks"],
     responses={404: {"description": "Not found"}}
 )
 
+def _schema_response(content: BaseModel | List[BaseModel]) -> ORJSONResponse:
+    """
+    서비스가 만든 응답 스키마를 그대로 JSON 응답으로 변환
+    
+    response_model로 반환하면 FastAPI가 모델을 dict로 덤프한 뒤 다시 검증하고 직렬화하므로,
+    이미 스키마 객체인 결과는 한 번만 덤프하여 orjson으로 바로 렌더링
+    (response_model은 문서화 용도로 유지)
+    """
+    if isinstance(content, list):
+        return ORJSONResponse(content=[item.model_dump(mode="json") for item in content])
+    return ORJSONResponse(content=content.model_dump(mode="json"))
+
+# 핸들러는 동기 함수로 정의 (서비스/저장소가 동기 DB 세션을 사용하므로 async로 정의하면 이벤트 루프가 블로킹됨)
+# FastAPI가 동기 핸들러를 스레드 풀에서 실행하므로 DB 대기 중에도 다른 요청 처리 가능
+
 @router.get("/", response_model=TrademarkSearchResponse)
-async def search_trademarks(
+def search_trademarks(
     # 모델을 직접 의존성으로 사용
     params: Annotated[TrademarkSearchParams, Depends()],  
     service: TrademarkServiceDep
@@ -35,15 +56,29 @@ async def search_trademarks(
     # 검색 로그 기록
     logger.info(f"상표 검색 완료: 검색어='{params.query}', 필터=[상태='{params.status}', 상품코드='{params.product_code}', 날짜범위='{params.from_date}~{params.to_date}'], 결과={total_count}건")
     
-    return TrademarkSearchResponse(
+    return _schema_response(TrademarkSearchResponse(
         total=total_count,
         offset=params.offset,
         limit=params.limit,
         results=results
-    )
+    ))
+
+@router.post("/bulk", response_model=List[TrademarkDetail])
+def get_trademarks_bulk(
+    trademark_ids: Annotated[List[int], Body(min_length=1, max_length=100, description="조회할 상표 ID 목록 (최대 100개)")],
+    service: TrademarkServiceDep
+):
+    """
+    상표 상세 정보 일괄 조회 API 엔드포인트
+    
+    여러 상표를 한 번의 요청과 한 번의 쿼리로 조회합니다. 존재하지 않는 ID는 결과에서 제외됩니다.
+    """
+    trademarks = service.get_trademarks_by_ids(trademark_ids)
+    logger.info(f"상표 일괄 조회 완료: 요청 {len(trademark_ids)}건, 결과 {len(trademarks)}건")
+    return _schema_response(trademarks)
 
 @router.get("/{trademark_id}", response_model=TrademarkDetail)
-async def get_trademark_detail(
+def get_trademark_detail(
     trademark_id: str,
     service: TrademarkServiceDep
 ):
@@ -59,10 +94,11 @@ async def get_trademark_detail(
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="상표를 찾을 수 없습니다")
     
     logger.info(f"상표 ID '{trademark_id}' 조회 성공")
-    return trademark
+    return _schema_response(trademark)
 
 @router.get("/meta/statuses", response_model=List[str])
-async def get_register_statuses(
+def get_register_statuses(
+    response: Response,
     service: TrademarkServiceDep
 ):
     """
@@ -71,11 +107,13 @@ async def get_register_statuses(
     등록 가능한 모든 상태값(등록, 출원, 거절 등)의 목록을 반환합니다.
     """
     statuses = service.get_register_statuses()
+    response.headers["Cache-Control"] = _META_CACHE_CONTROL
     logger.info(f"등록 상태 목록 조회 성공: {len(statuses)}개 항목")
     return statuses
     
 @router.get("/meta/product-codes", response_model=List[str])
-async def get_product_codes(
+def get_product_codes(
+    response: Response,
     service: TrademarkServiceDep
 ):
     """
@@ -84,5 +122,6 @@ async def get_product_codes(
     상표 분류에 사용되는 모든 상품 분류 코드 목록을 반환합니다.
     """
     codes = service.get_product_codes()
+    response.headers["Cache-Control"] = _META_CACHE_CONTROL
     logger.info(f"상품 분류 코드 목록 조회 성공: {len(codes)}개 항목")
     return codes
\ No newline at end of file
@@ -1,8 +1,14 @@
-from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict
+from pydantic import BaseModel, Field, field_validator, model_validator, ConfigDict, PlainSerializer
 from typing import List, Optional, Dict, Any, Annotated
 from datetime import date
 from enum import Enum
 
+from ..utils.dates import parse_yyyymmdd
+
+# 응답용 날짜 타입 - JSON 직렬화 시 YYYYMMDD 형식으로 통일
+# (v2에서 폐기 예정인 json_encoders 대신 스키마에 직접 연결되는 직렬화기 사용)
+CompactDate = Annotated[date, PlainSerializer(lambda v: v.strftime("%Y%m%d"), return_type=str, when_used="json")]
+
 # 날짜 타입 열거형 (검증 및 문서화 목적)
 class DateFieldType(str, Enum):
     APPLICATION_DATE = "applicationDate"
@@ -29,10 +35,10 @@ class TrademarkSearchParams(BaseModel):
     @field_validator('from_date', 'to_date')
     @classmethod
     def validate_date_format(cls, v: Optional[str]) -> Optional[str]:
-        import re
         if v is None:
             return None
-        if not re.match(r'^\d{8}$', v):
+        # 정규식 대신 길이/숫자 검사 (isascii로 전각·유니코드 숫자 제외)
+        if len(v) != 8 or not (v.isascii() and v.isdigit()):
             raise ValueError("날짜는 YYYYMMDD 형식이어야 합니다")
         return v
     
@@ -40,18 +46,16 @@ class TrademarkSearchParams(BaseModel):
     @model_validator(mode='after')
     def validate_date_range(self) -> 'TrademarkSearchParams':
         if self.from_date and self.to_date:
-            # 문자열을 날짜로 변환
+            # 문자열을 날짜로 변환 (형식은 field_validator에서 검증됨, 존재하지 않는 날짜만 확인)
             try:
-                from_date = date(int(self.from_date[:4]), int(self.from_date[4:6]), int(self.from_date[6:8]))
-                to_date = date(int(self.to_date[:4]), int(self.to_date[4:6]), int(self.to_date[6:8]))
-                
-                # 시작일이 종료일보다 나중이면 오류
-                if from_date > to_date:
-                    raise ValueError("시작 날짜는 종료 날짜보다 이전이어야 합니다")
+                from_date = parse_yyyymmdd(self.from_date)
+                to_date = parse_yyyymmdd(self.to_date)
             except ValueError as e:
-                # 날짜 변환 오류는 이미 field_validator에서 검증됨
-                if "날짜는 YYYYMMDD 형식이어야 합니다" not in str(e):
-                    raise ValueError(f"잘못된 날짜 형식: {str(e)}")
+                raise ValueError(f"잘못된 날짜 형식: {str(e)}")
+            
+            # 시작일이 종료일보다 나중이면 오류
+            if from_date > to_date:
+                raise ValueError("시작 날짜는 종료 날짜보다 이전이어야 합니다")
         return self
     
     # 모델 설정
@@ -67,25 +71,18 @@ class SearchResult(BaseModel):
     productNameEng: Optional[str] = None
     
     # 날짜 필드를 date 타입으로 사용
-    applicationDate: Optional[date] = None
+    applicationDate: Optional[CompactDate] = None
     registerStatus: Optional[str] = None
     
     # 명시적 리스트 필드 (None도 허용 + 기본값 추가)
     registrationNumber: List[str] | None = Field(default_factory=list)
-    registrationDate: List[date] | None = Field(default_factory=list)
+    registrationDate: List[CompactDate] | None = Field(default_factory=list)
     
     # 배열 필드
     asignProductMainCodeList: List[str] | None = Field(default_factory=list)
     
     # 유사도 점수 필드 추가
     similarity_score: Optional[float] = None
-    
-    model_config = ConfigDict(
-        json_encoders = {
-            # 날짜 필드 직렬화를 YYYYMMDD 형식으로 통일
-            date: lambda v: v.strftime("%Y%m%d") if v else None,
-        }
-    )
 
 class TrademarkSearchResponse(BaseModel):
     """상표 검색 응답"""
@@ -101,31 +98,24 @@ class TrademarkDetail(BaseModel):
     applicationNumber: str = Field(..., description="출원 번호")
     
     # 날짜 필드를 date 타입으로 수정
-    applicationDate: Optional[date] = Field(None, description="출원일")
+    applicationDate: Optional[CompactDate] = Field(None, description="출원일")
     registerStatus: Optional[str] = Field(None, description="등록 상태")
     publicationNumber: Optional[str] = Field(None, description="공고 번호")
-    publicationDate: Optional[date] = Field(None, description="공고일")
+    publicationDate: Optional[CompactDate] = Field(None, description="공고일")
     
     # 배열 타입으로 수정
     registrationNumber: Optional[List[str]] = Field(default_factory=list, description="등록 번호")
-    registrationDate: Optional[List[date]] = Field(default_factory=list, description="등록일")
+    registrationDate: Optional[List[CompactDate]] = Field(default_factory=list, description="등록일")
     
     # 추가 필드
     registrationPubNumber: Optional[str] = Field(None, description="등록공고 번호")
-    registrationPubDate: Optional[date] = Field(None, description="등록공고일")
+    registrationPubDate: Optional[CompactDate] = Field(None, description="등록공고일")
     
     # 배열 필드 - 명시적 기본값 설정
     internationalRegNumbers: Optional[List[str]] = Field(default_factory=list, description="국제 출원 번호")
-    internationalRegDate: Optional[date] = Field(None, description="국제출원일")
+    internationalRegDate: Optional[CompactDate] = Field(None, description="국제출원일")
     priorityClaimNumList: Optional[List[str]] = Field(default_factory=list, description="우선권 번호")
-    priorityClaimDateList: Optional[List[date]] = Field(default_factory=list, description="우선권 일자")
+    priorityClaimDateList: Optional[List[CompactDate]] = Field(default_factory=list, description="우선권 일자")
     asignProductMainCodeList: Optional[List[str]] = Field(default_factory=list, description="상품 주 분류 코드")
     asignProductSubCodeList: Optional[List[str]] = Field(default_factory=list, description="상품 유사군 코드")
-    viennaCodeList: Optional[List[str]] = Field(default_factory=list, description="비엔나 코드")
-
-    model_config = ConfigDict(
-        json_encoders = {
-            # 날짜 필드 직렬화를 YYYYMMDD 형식으로 통일
-            date: lambda v: v.strftime("%Y%m%d") if v else None,
-        }
-    )
\ No newline at end of file
+    viennaCodeList: Optional[List[str]] = Field(default_factory=list, description="비엔나 코드")
\ No newline at end of file
@@ -1,17 +1,27 @@
-import json
 import os
 import sys
 import logging
-import datetime
 from sqlalchemy import text
-from sqlalchemy.dialects.postgresql import insert
+
+try:
+    import orjson as _json  # 설치되어 있으면 더 빠른 orjson 사용
+except ImportError:
+    import json as _json
+
+try:
+    import ijson  # 설치되어 있으면 JSON 배열을 스트리밍으로 파싱
+except ImportError:
+    ijson = None
 
 # 상위 디렉토리를 import path에 추가
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from app.database import SessionLocal, init_db
-from app.models.trademark import Trademark
-from app.config import settings
+from app.repositories.postgresql.trademark_repository import PostgresTrademarkRepository
+from app.config import get_settings
+from app.utils.dates import parse_yyyymmdd
+
+settings = get_settings()
 
 # 로깅 설정
 logging.basicConfig(
@@ -20,91 +30,110 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# null로 취급할 원본 값
+_NULL_VALUES = ("null", "")
+
+# 날짜 필드 (YYYYMMDD 문자열 -> date)
+_DATE_FIELDS = ("applicationDate", "publicationDate")
+
+# 리스트 필드
+_LIST_FIELDS = (
+    "registrationNumber",  # 샘플에서 배열로 제공됨
+    "registrationDate",    # 샘플에서 배열로 제공됨
+    "internationalRegNumbers", 
+    "priorityClaimNumList", 
+    "priorityClaimDateList", 
+    "asignProductMainCodeList", 
+    "asignProductSubCodeList", 
+    "viennaCodeList"
+)
+
 def convert_date_string(date_str):
     """YYYYMMDD 형식의 문자열을 datetime.date 객체로 변환"""
-    if not date_str or date_str == "null" or len(date_str) != 8:
+    if not date_str or date_str == "null":
         return None
     
     try:
-        return datetime.date(
-            year=int(date_str[:4]),
-            month=int(date_str[4:6]),
-            day=int(date_str[6:8])
-        )
-    except (ValueError, TypeError):
-        logger.warning(f"잘못된 날짜 형식: {date_str}")
+        return parse_yyyymmdd(date_str)
+    except ValueError:
+        # 대량 적재 중 반복 출력되지 않도록 DEBUG 레벨로 기록
+        logger.debug("잘못된 날짜 형식: %s", date_str)
         return None
 
 def preprocess_trademark_data(data):
     """상표 데이터 전처리 함수"""
-    processed_data = {}
-    
-    # 기본 필드 처리
-    for key, value in data.items():
-        # null 값 처리
-        if value == "null" or value == "":
-            processed_data[key] = None
-        else:
-            processed_data[key] = value
+    # 기본 필드 처리 (null 값 처리)
+    processed_data = {key: None if value in _NULL_VALUES else value for key, value in data.items()}
     
     # 날짜 필드를 Date 타입으로 변환
-    date_fields = ["applicationDate", "publicationDate"]
-    for field in date_fields:
-        if field in processed_data and processed_data[field]:
-            processed_data[field] = convert_date_string(processed_data[field])
+    for field in _DATE_FIELDS:
+        value = processed_data.get(field)
+        if value:
+            processed_data[field] = convert_date_string(value)
     
     # 리스트 필드 처리
-    list_fields = [
-        "registrationNumber",  # 샘플에서 배열로 제공됨
-        "registrationDate",    # 샘플에서 배열로 제공됨
-        "internationalRegNumbers", 
-        "priorityClaimNumList", 
-        "priorityClaimDateList", 
-        "asignProductMainCodeList", 
-        "asignProductSubCodeList", 
-        "viennaCodeList"
-    ]
-    
-    for field in list_fields:
-        if field in processed_data:
-            # 이미 리스트인 경우
-            if isinstance(processed_data[field], list):
-                continue
-                
-            # 문자열을 리스트로 변환 (쉼표로 구분)
-            elif isinstance(processed_data[field], str):
-                processed_data[field] = [item.strip() for item in processed_data[field].split(',') if item.strip()]
-                
-            # None인 경우 빈 리스트로 변환
-            elif processed_data[field] is None:
-                processed_data[field] = []
-                
-            # 기타 타입은 단일 요소 리스트로 변환
-            else:
-                processed_data[field] = [processed_data[field]]
+    for field in _LIST_FIELDS:
+        if field not in processed_data:
+            continue
+        value = processed_data[field]
+        
+        # 이미 리스트인 경우
+        if isinstance(value, list):
+            continue
+        
+        # 문자열을 리스트로 변환 (쉼표로 구분)
+        elif isinstance(value, str):
+            processed_data[field] = [item for item in map(str.strip, value.split(',')) if item]
+        
+        # None인 경우 빈 리스트로 변환
+        elif value is None:
+            processed_data[field] = []
+        
+        # 기타 타입은 단일 요소 리스트로 변환
+        else:
+            processed_data[field] = [value]
     
     return processed_data
 
-def load_json_to_db(json_file_path):
-    """JSON 파일을 PostgreSQL 데이터베이스에 로드"""
+def iter_trademark_records(json_file_path):
+    """
+    JSON 배열 파일의 상표 레코드를 하나씩 반환
+    
+    ijson이 있으면 파일 전체를 메모리에 올리지 않고 스트리밍으로 파싱하며,
+    없으면 파일 전체를 한 번에 파싱
+    """
+    with open(json_file_path, 'rb') as file:
+        if ijson is not None:
+            # use_float=True: 숫자를 Decimal 대신 float/int로 반환 (json.load와 동일)
+            yield from ijson.items(file, 'item', use_float=True)
+        else:
+            # 바이트 그대로 파싱 (orjson 사용 시 디코딩 단계 생략)
+            yield from _json.loads(file.read())
+
+def load_json_to_db(json_file_path, backfill=False):
+    """
+    JSON 파일을 PostgreSQL 데이터베이스에 로드
+    
+    적재 전에 init_db()가 검색 컬럼 트리거를 생성하므로 삽입/갱신되는 행의 검색 컬럼은 트리거가 채움.
+    backfill=True이면 적재 후 전체 테이블의 검색 컬럼을 다시 계산 (트리거 생성 이전에 들어간 기존 행용)
+    """
     try:
-        # 데이터베이스 초기화 (테이블 생성)
+        # 데이터베이스 초기화 (테이블 및 검색 컬럼 트리거 생성)
         init_db()
         
-        # JSON 파일 로드
+        # JSON 파일 로드 (레코드를 읽는 대로 배치 단위로 적재, 총 건수는 적재하면서 집계)
         logger.info(f"데이터 로드 중: {json_file_path}")
-        with open(json_file_path, 'r', encoding='utf-8') as file:
-            trademarks_data = json.load(file)
-        
-        logger.info(f"총 {len(trademarks_data)}개의 상표 데이터를 찾았습니다.")
+        trademarks_data = iter_trademark_records(json_file_path)
         
         # 세션 생성
         db = SessionLocal()
+        repository = PostgresTrademarkRepository(db)
         
         try:
             # 데이터 카운터
             count = 0
-            batch_size = 100
+            # COPY는 파라미터 수 제한이 없으므로 배치를 크게 잡아 커밋 횟수를 줄임
+            batch_size = 5000
             
             # 배치 처리를 위한 리스트
             batch = []
@@ -124,38 +153,35 @@ def load_json_to_db(json_file_path):
                 
                 # 배치 크기에 도달하면 데이터베이스에 삽입
                 if len(batch) >= batch_size:
-                    # upsert 작업 (on conflict do update)
-                    db.execute(insert(Trademark).values(batch).on_conflict_do_update(
-                        index_elements=['id'],
-                        set_={k: insert(Trademark).excluded[k] for k in processed_data.keys() if k != 'id'}
-                    ))
-                    db.commit()
+                    # COPY로 스테이징 후 upsert (on conflict do update)
+                    repository.copy_insert(batch)
                     logger.info(f"{count}개 데이터 처리 완료")
                     batch = []
             
             # 남은 배치 처리
             if batch:
-                db.execute(insert(Trademark).values(batch).on_conflict_do_update(
-                    index_elements=['id'],
-                    set_={k: insert(Trademark).excluded[k] for k in processed_data.keys() if k != 'id'}
-                ))
-                db.commit()
+                repository.copy_insert(batch)
                 logger.info(f"{count}개 데이터 처리 완료 (마지막 배치)")
             
-            # 전문 검색 벡터 업데이트
-            logger.info("검색 벡터 업데이트 중...")
-            db.execute(text("""
-                UPDATE trademarks 
-                SET search_vector = 
-                    setweight(to_tsvector('simple', coalesce("productName", '')), 'A') ||
-                    setweight(to_tsvector('simple', coalesce("productNameEng", '')), 'B') ||
-                    setweight(to_tsvector('simple', coalesce("applicationNumber", '')), 'C') ||
-                    setweight(to_tsvector('simple', coalesce(array_to_string("registrationNumber", ' '), '')), 'C')
-            """))
-            db.commit()
+            # 검색 컬럼은 행마다 트리거로 계산되므로 전체 테이블 재계산은 요청 시에만 수행
+            if backfill:
+                logger.info("검색 벡터 전체 재계산 중...")
+                db.execute(text("""
+                    UPDATE trademarks 
+                    SET search_vector = 
+                        setweight(to_tsvector('simple', coalesce("productName", '')), 'A') ||
+                        setweight(to_tsvector('simple', coalesce("productNameEng", '')), 'B') ||
+                        setweight(to_tsvector('simple', coalesce("applicationNumber", '')), 'C') ||
+                        setweight(to_tsvector('simple', coalesce(array_to_string("registrationNumber", ' '), '')), 'C'),
+                        search_trgm = 
+                        coalesce("productName", '') || ' ' ||
+                        coalesce("productNameEng", '') || ' ' ||
+                        coalesce("applicationNumber", '') || ' ' ||
+                        coalesce(array_to_string("registrationNumber", ','), '')
+                """))
+                db.commit()
+                logger.info("검색 벡터 전체 재계산 완료")
             
-            # 트리거는 init_db()에서 이미 생성됨
-            logger.info("검색 벡터 업데이트 완료")
             logger.info(f"데이터베이스 로드 완료: 총 {count}개 상표 데이터")
             
         except Exception as e:
@@ -171,9 +197,13 @@ def load_json_to_db(json_file_path):
 
 if __name__ == "__main__":
     # 커맨드 라인 인자로 JSON 파일 경로를 받거나 환경변수 또는 기본 경로 사용
-    if len(sys.argv) > 1:
-        json_file_path = sys.argv[1]
+    # --backfill: 적재 후 기존 행까지 검색 컬럼 전체 재계산
+    args = [arg for arg in sys.argv[1:] if arg != "--backfill"]
+    backfill = "--backfill" in sys.argv[1:]
+    
+    if args:
+        json_file_path = args[0]
     else:
         json_file_path = settings.DATA_FILE_PATH
     
-    load_json_to_db(json_file_path)
\ No newline at end of file
+    load_json_to_db(json_file_path, backfill=backfill)
\ No newline at end of file
@@ -4,7 +4,7 @@ from sqlalchemy.orm import Session
 from ..schemas import TrademarkSearchParams, SearchResult, TrademarkDetail
 from ..repositories.trademark_repository import ITrademarkRepository
 from ..repositories.factory import get_trademark_repository
-from ..utils.dto import to_schema, to_schema_list
+from ..utils.dto import to_schema_fast, to_schema_list
 from ..utils.search import fuzzy_match, calculate_similarity
 
 # 로거 설정
@@ -33,7 +33,7 @@ class TrademarkService:
         """
         try:
             # 검색 파라미터 로깅
-            logger.debug(f"상표 검색 요청: 검색어='{params.query}', 상태='{params.status}', 상품코드='{params.product_code}'")
+            logger.debug("상표 검색 요청: 검색어='%s', 상태='%s', 상품코드='%s'", params.query, params.status, params.product_code)
             
             # 저장소를 통해 데이터 검색
             trademarks, total_count = self.repository.search(params)
@@ -44,25 +44,18 @@ class TrademarkService:
             # 검색어가 있고 결과가 적은 경우(10개 이하), Python 퍼지 매칭으로 후처리
             # 대량 데이터에서는 이 로직이 무거울 수 있으므로 결과가 적을 때만 실행
             if params.query and len(results) <= 10:
-                logger.debug(f"Python 퍼지 매칭 후처리 적용 - 결과 {len(results)}건")
+                logger.debug("Python 퍼지 매칭 후처리 적용 - 결과 %s건", len(results))
                 # 결과 정렬 - 유사도에 따라 재정렬
+                # (스키마 객체에 임시 필드를 쓰고 지우는 대신 점수를 별도 리스트로 계산)
                 if results:
-                    # 상표명 유사도 계산 (None 체크 필요)
-                    for result in results:
-                        # productName이 None이면 빈 문자열로 대체
-                        product_name = result.productName or ""
-                        # 유사도 점수 계산 및 저장 (임시 필드)
-                        result.similarity_score = calculate_similarity(product_name, params.query)
+                    # 상표명 유사도 계산 (productName이 None이면 빈 문자열로 대체)
+                    scores = [calculate_similarity(result.productName or "", params.query) for result in results]
                     
-                    # 유사도에 따라 내림차순 정렬
-                    results.sort(key=lambda x: x.similarity_score, reverse=True)
-                    
-                    # 임시 필드 제거
-                    for result in results:
-                        if hasattr(result, 'similarity_score'):
-                            delattr(result, 'similarity_score')
+                    # 유사도에 따라 내림차순 정렬 (동점은 기존 순서 유지)
+                    order = sorted(range(len(results)), key=scores.__getitem__, reverse=True)
+                    results = [results[i] for i in order]
             
-            logger.debug(f"상표 검색 결과: {total_count}건 중 {len(results)}건 반환")
+            logger.debug("상표 검색 결과: %s건 중 %s건 반환", total_count, len(results))
             return results, total_count
             
         except Exception as e:
@@ -84,26 +77,45 @@ class TrademarkService:
             try:
                 id_value = int(trademark_id)
             except ValueError:
-                logger.debug(f"상표 ID '{trademark_id}' 변환 실패: 정수로 변환할 수 없음")
+                logger.debug("상표 ID '%s' 변환 실패: 정수로 변환할 수 없음", trademark_id)
                 return None
                 
             # 저장소를 통해 데이터 조회
             trademark = self.repository.find_by_id(id_value)
             
             if not trademark:
-                logger.debug(f"상표 ID '{trademark_id}' 조회: 해당 상표를 찾을 수 없음")
+                logger.debug("상표 ID '%s' 조회: 해당 상표를 찾을 수 없음", trademark_id)
                 return None
             
-            # DB 모델을 응답 스키마로 변환 - 헬퍼 함수 활용
-            detail = to_schema(trademark, TrademarkDetail)
+            # DB 모델을 응답 스키마로 변환 - DB 데이터이므로 검증 생략 경로 사용
+            detail = to_schema_fast(trademark, TrademarkDetail)
             
-            logger.debug(f"상표 ID '{trademark_id}' 조회 성공: {trademark.productName}")
+            logger.debug("상표 ID '%s' 조회 성공: %s", trademark_id, trademark.productName)
             return detail
             
         except Exception as e:
             logger.error(f"상표 상세 정보 조회 중 서비스 계층 오류: {str(e)}")
             raise
 
+    def get_trademarks_by_ids(self, trademark_ids: List[int]) -> List[TrademarkDetail]:
+        """
+        여러 ID의 상표 상세 정보 일괄 조회
+        
+        Args:
+            trademark_ids: 조회할 상표 ID 목록
+            
+        Returns:
+            상표 상세 정보 리스트 (요청한 ID 순서, 존재하지 않는 ID는 제외)
+        """
+        try:
+            # 저장소를 통해 한 번에 조회 (ID마다 find_by_id를 호출하지 않음)
+            trademarks = self.repository.find_by_ids(trademark_ids)
+            logger.debug("상표 일괄 조회: 요청 %s건 중 %s건 조회", len(trademark_ids), len(trademarks))
+            return to_schema_list(trademarks, TrademarkDetail)
+        except Exception as e:
+            logger.error(f"상표 일괄 조회 중 서비스 계층 오류: {str(e)}")
+            raise
+
     def get_register_statuses(self) -> List[str]:
         """
         등록 상태 목록 조회
@@ -113,7 +125,7 @@ class TrademarkService:
         """
         try:
             statuses = self.repository.get_register_statuses()
-            logger.debug(f"등록 상태 목록 조회: {len(statuses)}개 항목")
+            logger.debug("등록 상태 목록 조회: %s개 항목", len(statuses))
             return statuses
         except Exception as e:
             logger.error(f"등록 상태 목록 조회 중 서비스 계층 오류: {str(e)}")
@@ -128,7 +140,7 @@ class TrademarkService:
         """
         try:
             codes = self.repository.get_product_codes()
-            logger.debug(f"상품 분류 코드 목록 조회: {len(codes)}개 항목")
+            logger.debug("상품 분류 코드 목록 조회: %s개 항목", len(codes))
             return codes
         except Exception as e:
             logger.error(f"상품 분류 코드 목록 조회 중 서비스 계층 오류: {str(e)}")
@@ -1,2 +1,3 @@
-from .dto import to_schema, to_schema_list
+from .dates import parse_yyyymmdd
+from .dto import to_schema, to_schema_fast, to_schema_list
 from .search import is_korean, matches_initial_consonants, extract_initial_consonants, get_initial_consonant
\ No newline at end of file
@@ -0,0 +1,21 @@
+from datetime import date
+
+def parse_yyyymmdd(value: str) -> date:
+    """
+    YYYYMMDD 문자열을 날짜로 변환
+    
+    C로 구현된 date.fromisoformat 사용 (YYYY-MM-DD 형태로 재구성, 슬라이스별 int 변환보다 빠름)
+    
+    Args:
+        value: YYYYMMDD 형식의 날짜 문자열
+        
+    Returns:
+        변환된 날짜 객체
+        
+    Raises:
+        ValueError: 8자리 숫자가 아니거나 존재하지 않는 날짜인 경우
+    """
+    # isascii로 전각·유니코드 숫자 제외
+    if len(value) != 8 or not (value.isascii() and value.isdigit()):
+        raise ValueError(f"YYYYMMDD 형식이 아닙니다: {value}")
+    return date.fromisoformat(f"{value[:4]}-{value[4:6]}-{value[6:]}")
\ No newline at end of file
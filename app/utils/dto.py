@@ -1,10 +1,23 @@
 from typing import List, TypeVar, Type, Optional
-from pydantic import BaseModel
+from functools import lru_cache
+from pydantic import BaseModel, TypeAdapter
 
 # 제네릭 타입 변수 정의
 ModelT = TypeVar('ModelT')  # SQLAlchemy 모델 타입
 SchemaT = TypeVar('SchemaT', bound=BaseModel)  # Pydantic 스키마 타입
 
+# DB에서 읽은 (이미 검증된) 데이터에 대해 검증을 생략하는 빠른 변환 사용 여부
+# False로 두면 모든 변환이 model_validate 경로를 사용
+TRUSTED_FAST_CONVERSION = True
+
+# 모델 객체에 속성이 없는 경우를 구분하기 위한 표식
+_MISSING = object()
+
+@lru_cache(maxsize=None)
+def _list_adapter(schema_class: Type[SchemaT]) -> TypeAdapter:
+    """스키마별 List[schema_class] TypeAdapter (생성 비용이 크므로 한 번만 생성)"""
+    return TypeAdapter(List[schema_class])
+
 def to_schema(model_obj: Optional[ModelT], schema_class: Type[SchemaT]) -> Optional[SchemaT]:
     """
     DB 모델 객체를 Pydantic 스키마로 변환
@@ -20,10 +33,40 @@ def to_schema(model_obj: Optional[ModelT], schema_class: Type[SchemaT]) -> Optio
         return None
     return schema_class.model_validate(model_obj, from_attributes=True)
 
+def to_schema_fast(model_obj: Optional[ModelT], schema_class: Type[SchemaT]) -> Optional[SchemaT]:
+    """
+    DB 모델 객체를 검증 없이 Pydantic 스키마로 변환
+    
+    DB에서 읽은 신뢰할 수 있는 데이터 전용 (외부 입력에는 to_schema 사용).
+    모델에 없는 속성은 스키마 기본값으로 채워지고, NULL 값(None)은
+    검증 경로와 같이 그대로 유지됨
+    
+    Args:
+        model_obj: SQLAlchemy 모델 객체
+        schema_class: 변환할 Pydantic 스키마 클래스
+        
+    Returns:
+        변환된 Pydantic 스키마 객체
+    """
+    if model_obj is None:
+        return None
+    if not TRUSTED_FAST_CONVERSION:
+        return to_schema(model_obj, schema_class)
+    
+    data = {}
+    for name in schema_class.model_fields:
+        value = getattr(model_obj, name, _MISSING)
+        if value is not _MISSING:
+            data[name] = value
+    return schema_class.model_construct(**data)
+
 def to_schema_list(model_objs: Optional[List[ModelT]], schema_class: Type[SchemaT]) -> List[SchemaT]:
     """
     DB 모델 객체 리스트를 Pydantic 스키마 리스트로 변환
     
+    DB 조회 결과 변환용이므로 to_schema_fast 경로를 사용하며,
+    검증이 필요한 경우에는 캐시된 TypeAdapter로 리스트 전체를 한 번에 검증
+    
     Args:
         model_objs: SQLAlchemy 모델 객체 리스트
         schema_class: 변환할 Pydantic 스키마 클래스
@@ -33,4 +76,6 @@ def to_schema_list(model_objs: Optional[List[ModelT]], schema_class: Type[Schema
     """
     if not model_objs:
         return []
-    return [to_schema(obj, schema_class) for obj in model_objs]
\ No newline at end of file
+    if not TRUSTED_FAST_CONVERSION:
+        return _list_adapter(schema_class).validate_python(model_objs, from_attributes=True)
+    return [to_schema_fast(obj, schema_class) for obj in model_objs]
\ No newline at end of file
@@ -1,7 +1,14 @@
 import re
 from difflib import SequenceMatcher
+from functools import lru_cache
 from typing import List, Dict, Any, Optional
 
+try:
+    # 설치되어 있으면 C++ 구현인 rapidfuzz 사용 (Indel 정규화 유사도 = 2*LCS/(len(a)+len(b)))
+    from rapidfuzz.distance import Indel as _Indel
+except ImportError:
+    _Indel = None
+
 def fuzzy_match(text: str, query: str, threshold: float = 0.6) -> bool:
     """
     퍼지 매칭 함수: 텍스트와 쿼리 간의 유사도 계산
@@ -17,27 +24,32 @@ def fuzzy_match(text: str, query: str, threshold: float = 0.6) -> bool:
     # 널값 처리
     if text is None or query is None:
         return False
+    
+    # 소문자 변환은 한 번만 수행
+    text_lower = text.lower()
+    query_lower = query.lower()
         
-    # 정확히 포함된 경우
-    if query.lower() in text.lower():
+    # 정확히 포함된 경우 (완전 일치 포함)
+    if query_lower in text_lower:
         return True
     
     # 한글 초성 검색 지원 (모든 문자가 초성인 경우)
-    if all(char in 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ' for char in query):
+    if not query.translate(_INITIAL_DELETE_TABLE):
         if matches_initial_consonants(text, query):
             return True
     
-    # 유사도 계산
-    similarity = calculate_similarity(text, query)
+    # 유사도 계산 (포함 여부는 위에서 확인했으므로 바로 비교, 임계값 미만이 확실하면 계산 도중 중단)
+    similarity = _ratio(text_lower, query_lower, threshold)
     return similarity >= threshold
 
-def calculate_similarity(text: str, query: str) -> float:
+def calculate_similarity(text: str, query: str, score_cutoff: float = 0.0) -> float:
     """
     두 문자열 간의 유사도 계산
     
     Args:
         text: 대상 텍스트
         query: 검색어
+        score_cutoff: 최소 유사도 (이 값 미만이면 정확한 계산 없이 0.0 반환)
         
     Returns:
         유사도 (0.0 ~ 1.0)
@@ -46,22 +58,53 @@ def calculate_similarity(text: str, query: str) -> float:
     if text is None or query is None:
         return 0.0
         
-    # 완전 일치일 경우 1.0 반환
-    if text.lower() == query.lower():
-        return 1.0
-        
     # 모두 소문자로 변환하여 비교
     text_lower = text.lower()
     query_lower = query.lower()
     
+    # 완전 일치일 경우 1.0 반환
+    if text_lower == query_lower:
+        return 1.0
+    
     # 정확히 포함된 경우 높은 점수 부여
     if query_lower in text_lower:
         return 0.9
     
-    # difflib의 SequenceMatcher 사용
+    return _ratio(text_lower, query_lower, score_cutoff)
+
+def _ratio(text_lower: str, query_lower: str, score_cutoff: float) -> float:
+    """
+    소문자로 변환된 두 문자열의 편집 유사도 (포함/일치 여부는 호출자가 확인)
+    
+    Args:
+        text_lower: 소문자 대상 텍스트
+        query_lower: 소문자 검색어
+        score_cutoff: 최소 유사도 (이 값 미만이면 0.0 반환)
+        
+    Returns:
+        유사도 (0.0 ~ 1.0)
+    """
+    # 길이 차이만으로 가능한 최대 유사도(2*짧은 길이/길이 합)가 기준 미만이면 계산 생략
+    if score_cutoff:
+        total = len(text_lower) + len(query_lower)
+        if not total or 2 * min(len(text_lower), len(query_lower)) / total < score_cutoff:
+            return 0.0
+    
+    if _Indel is not None:
+        return _Indel.normalized_similarity(text_lower, query_lower, score_cutoff=score_cutoff)
+    
+    # rapidfuzz가 없으면 difflib의 SequenceMatcher 사용 (상한값으로 먼저 걸러냄)
     matcher = SequenceMatcher(None, text_lower, query_lower)
-    return matcher.ratio()
+    if score_cutoff and matcher.quick_ratio() < score_cutoff:
+        return 0.0
+    ratio = matcher.ratio()
+    return ratio if ratio >= score_cutoff else 0.0
 
+# 한글 음절 패턴 (가-힣) - 모듈 로드 시 한 번만 컴파일
+_HANGUL_RE = re.compile(r'[가-힣]')
+
+# 순수 함수이므로 결과 캐시 (자주 검색되는 상표명의 반복 계산 방지)
+@lru_cache(maxsize=131072)
 def is_korean(text: str) -> bool:
     """
     문자열이 한글인지 확인
@@ -77,7 +120,16 @@ def is_korean(text: str) -> bool:
         return False
     
     # 한글 유니코드 범위: AC00-D7A3 (가-힣)
-    return bool(re.search(r'[가-힣]', text))
+    return _HANGUL_RE.search(text) is not None
+
+# 한글 초성 목록
+CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
+
+# 한글 음절(가-힣) -> 초성 변환 테이블 (str.translate로 문자열 전체를 C 레벨에서 한 번에 변환, 한 글자 조회에도 사용)
+_INITIAL_TRANSLATE_TABLE = {code: CHOSUNG[(code - 0xAC00) // (21 * 28)] for code in range(0xAC00, 0xD7A4)}
+
+# 초성 제거용 변환 테이블 (초성만으로 된 검색어인지 한 번의 translate로 판별)
+_INITIAL_DELETE_TABLE = str.maketrans("", "", "".join(CHOSUNG))
 
 def get_initial_consonant(char: str) -> Optional[str]:
     """
@@ -89,24 +141,13 @@ def get_initial_consonant(char: str) -> Optional[str]:
     Returns:
         초성 문자 또는 None
     """
-    if not is_korean(char):
+    if not char:
         return None
     
-    # 한글 초성 목록
-    CHOSUNG = ['ㄱ', 'ㄲ', 'ㄴ', 'ㄷ', 'ㄸ', 'ㄹ', 'ㅁ', 'ㅂ', 'ㅃ', 'ㅅ', 'ㅆ', 'ㅇ', 'ㅈ', 'ㅉ', 'ㅊ', 'ㅋ', 'ㅌ', 'ㅍ', 'ㅎ']
-    
-    # 한글 유니코드 계산
-    char_code = ord(char) - 0xAC00
-    
-    # 초성 인덱스 계산
-    idx = char_code // (21 * 28)
-    
-    # 인덱스가 범위 내인지 확인
-    if 0 <= idx < len(CHOSUNG):
-        return CHOSUNG[idx]
-    
-    return None
+    # 한글 음절이 아니면 테이블에 없으므로 None
+    return _INITIAL_TRANSLATE_TABLE.get(ord(char))
 
+@lru_cache(maxsize=131072)
 def extract_initial_consonants(text: str) -> str:
     """
     문자열에서 한글 초성만 추출
@@ -117,18 +158,10 @@ def extract_initial_consonants(text: str) -> str:
     Returns:
         초성만 추출한 문자열
     """
-    result = ""
-    
-    for char in text:
-        if is_korean(char):
-            initial = get_initial_consonant(char)
-            if initial:
-                result += initial
-        else:
-            result += char
-    
-    return result
+    # 한글 음절만 초성으로 치환하고 나머지 문자는 그대로 유지
+    return text.translate(_INITIAL_TRANSLATE_TABLE)
 
+@lru_cache(maxsize=131072)
 def matches_initial_consonants(text: str, query: str) -> bool:
     """
     문자열이 주어진 초성 패턴과 일치하는지 확인
@@ -140,8 +173,8 @@ def matches_initial_consonants(text: str, query: str) -> bool:
     Returns:
         초성 패턴이 일치하면 True, 아니면 False
     """
-    # 검색어가 모두 한글 초성인지 확인
-    if not all(char in 'ㄱㄲㄴㄷㄸㄹㅁㅂㅃㅅㅆㅇㅈㅉㅊㅋㅌㅍㅎ' for char in query):
+    # 검색어가 모두 한글 초성인지 확인 (초성을 지우고 남는 문자가 있으면 초성 패턴이 아님)
+    if query.translate(_INITIAL_DELETE_TABLE):
         return False
     
     # 대상 문자열의 초성만 추출
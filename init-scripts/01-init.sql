@@ -31,6 +31,12 @@ BEGIN
         setweight(to_tsvector('simple', coalesce(NEW.productNameEng, '')), 'B') ||
         setweight(to_tsvector('simple', coalesce(NEW.applicationNumber, '')), 'C') ||
         setweight(to_tsvector('simple', coalesce(array_to_string(NEW.registrationNumber, ' '), '')), 'C');
+    -- 트리그램 유사도 검색/KNN 정렬용 통합 문자열
+    NEW.search_trgm = 
+        coalesce(NEW.productName, '') || ' ' ||
+        coalesce(NEW.productNameEng, '') || ' ' ||
+        coalesce(NEW.applicationNumber, '') || ' ' ||
+        coalesce(array_to_string(NEW.registrationNumber, ','), '');
     RETURN NEW;
 END;
 $$ LANGUAGE plpgsql;
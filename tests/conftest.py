@@ -3,8 +3,9 @@ import sys
 import pytest
 from datetime import date
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker, Session
+from sqlalchemy.pool import StaticPool
 from typing import Generator, List
 
 # 프로젝트 루트 디렉토리를 Python 경로에 추가
@@ -21,32 +22,48 @@ from app.dependencies import get_trademark_repository_dependency, get_trademark_
 
 
 # 테스트용 인메모리 SQLite 데이터베이스 설정
+# StaticPool: 모든 세션이 같은 연결(같은 인메모리 DB)을 공유하여 스키마를 한 번만 생성
 TEST_DATABASE_URL = "sqlite:///:memory:"
-engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False})
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(TEST_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False)
+
+# pysqlite는 SAVEPOINT/롤백 처리가 불완전하므로 트랜잭션 시작을 SQLAlchemy가 직접 제어
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transaction(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(connection):
+    connection.exec_driver_sql("BEGIN")
 
 # 테스트 클라이언트
 @pytest.fixture
-def client() -> TestClient:
-    """FastAPI 테스트 클라이언트를 반환합니다."""
+def client(override_dependencies) -> TestClient:
+    """FastAPI 테스트 클라이언트를 반환합니다. (Mock 저장소 의존성 오버라이드 적용)"""
     return TestClient(app)
 
+# 테스트용 데이터베이스 스키마 (테스트 세션 전체에서 한 번만 생성/삭제)
+@pytest.fixture(scope="session")
+def db_schema() -> Generator[None, None, None]:
+    """테스트용 데이터베이스 스키마를 생성합니다."""
+    Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
+
 # 테스트용 데이터베이스 세션
 @pytest.fixture
-def db_session() -> Generator[Session, None, None]:
-    """테스트용 데이터베이스 세션을 생성합니다."""
-    # 데이터베이스 스키마 생성
-    Base.metadata.create_all(bind=engine)
-    
-    # 세션 생성
-    session = TestingSessionLocal()
+def db_session(db_schema) -> Generator[Session, None, None]:
+    """테스트용 데이터베이스 세션을 생성합니다. (테스트 종료 시 트랜잭션 롤백으로 데이터 원복)"""
+    connection = engine.connect()
+    transaction = connection.begin()
+    # 세션의 commit은 savepoint에만 반영되어 바깥 트랜잭션 롤백으로 모두 취소
+    session = TestingSessionLocal(bind=connection, join_transaction_mode="create_savepoint")
     try:
         yield session
     finally:
         session.close()
-    
-    # 테스트 후 스키마 삭제
-    Base.metadata.drop_all(bind=engine)
+        transaction.rollback()
+        connection.close()
 
 # Mock 저장소
 @pytest.fixture
@@ -105,8 +122,8 @@ def trademark_service(mock_repository: MockTrademarkRepository) -> TrademarkServ
     """Mock 저장소를 사용하는 서비스 인스턴스를 생성합니다."""
     return TrademarkService(mock_repository)
 
-# 의존성 오버라이드 (API 테스트용)
-@pytest.fixture(autouse=True)
+# 의존성 오버라이드 (API 테스트용 - client 픽스처를 사용하는 테스트에만 적용)
+@pytest.fixture
 def override_dependencies():
     """테스트에서 사용할 의존성 오버라이드"""
     # 의존성 백업
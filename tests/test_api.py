@@ -1,5 +1,6 @@
 import pytest
 from fastapi.testclient import TestClient
+from app import main
 
 class TestTrademarkAPI:
     """상표 API 엔드포인트 테스트"""
@@ -44,6 +45,15 @@ class TestTrademarkAPI:
         assert data["limit"] == 1
         assert data["offset"] == 0
     
+    def test_search_rejects_unknown_date_type(self, client: TestClient):
+        """허용되지 않은 날짜 필드 지정 시 검증 오류 테스트"""
+        # date_type은 출원일/등록일/공고일만 허용 (임의 모델 속성 지정 불가)
+        response = client.get("/api/v1/trademarks?date_type=productName&from_date=20230101")
+        assert response.status_code == 422
+        
+        response = client.get("/api/v1/trademarks?date_type=publicationDate&from_date=20230101")
+        assert response.status_code == 200
+    
     def test_get_trademark_detail(self, client: TestClient):
         """상표 상세 정보 조회 API 테스트"""
         # 존재하는 ID로 조회
@@ -58,6 +68,30 @@ class TestTrademarkAPI:
         response = client.get("/api/v1/trademarks/999")
         assert response.status_code == 404
     
+    def test_get_trademark_detail_null_arrays(self, client: TestClient):
+        """NULL 배열 필드가 빈 리스트가 아닌 null로 응답되는지 테스트 (응답 형식 고정)"""
+        response = client.get("/api/v1/trademarks/2")
+        assert response.status_code == 200
+    
+        data = response.json()
+        assert data["registrationNumber"] is None
+        assert data["registrationDate"] is None
+        assert data["viennaCodeList"] is None
+        assert data["asignProductMainCodeList"] == ["43"]
+    
+    def test_get_trademarks_bulk(self, client: TestClient):
+        """상표 일괄 조회 API 테스트"""
+        # 요청한 순서대로 반환하고 존재하지 않는 ID는 제외
+        response = client.post("/api/v1/trademarks/bulk", json=[2, 999, 1])
+        assert response.status_code == 200
+        
+        data = response.json()
+        assert [item["applicationNumber"] for item in data] == ["40-2023-0002", "40-2023-0001"]
+        
+        # 빈 목록은 검증 오류
+        response = client.post("/api/v1/trademarks/bulk", json=[])
+        assert response.status_code == 422
+    
     def test_get_register_statuses(self, client: TestClient):
         """등록 상태 목록 조회 API 테스트"""
         response = client.get("/api/v1/trademarks/meta/statuses")
@@ -67,6 +101,9 @@ class TestTrademarkAPI:
         assert isinstance(data, list)
         assert "등록" in data
         assert "출원" in data
+        
+        # 거의 변하지 않는 목록이므로 캐시 헤더 제공
+        assert response.headers["Cache-Control"].startswith("public, max-age=")
     
     def test_get_product_codes(self, client: TestClient):
         """상품 분류 코드 목록 조회 API 테스트"""
@@ -79,4 +116,17 @@ class TestTrademarkAPI:
         # 최소한 필수 코드들은 포함되어 있는지 확인
         required_codes = ["01", "02", "03", "05", "35", "42", "43"]
         for code in required_codes:
-            assert code in data
\ No newline at end of file
+            assert code in data
+    
+    def test_startup_fails_when_migration_fails(self, monkeypatch):
+        """RUN_MIGRATIONS 설정 시 init_db 실패가 애플리케이션 시작을 중단시키는지 테스트"""
+        def failing_init_db():
+            raise RuntimeError("migration failed")
+        
+        monkeypatch.setattr(main.settings, "RUN_MIGRATIONS", True)
+        monkeypatch.setattr(main, "get_connection_status", lambda: True)
+        monkeypatch.setattr(main, "init_db", failing_init_db)
+        
+        with pytest.raises(RuntimeError, match="migration failed"):
+            with TestClient(main.app):
+                pass
\ No newline at end of file
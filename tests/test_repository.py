@@ -3,6 +3,10 @@ from datetime import date
 from app.models.trademark import Trademark
 from app.schemas.trademark import TrademarkSearchParams
 from app.repositories.mock.trademark_repository import MockTrademarkRepository
+from app.repositories.postgresql.trademark_repository import PostgresTrademarkRepository, _COPY_COLUMNS, _STAGE_TABLE_DDL, _copy_statements
+from unittest.mock import MagicMock
+from sqlalchemy import select
+from sqlalchemy.dialects import postgresql
 
 class TestMockTrademarkRepository:
     """Mock 상표 저장소 테스트"""
@@ -19,6 +23,14 @@ class TestMockTrademarkRepository:
         trademark = mock_repository.find_by_id(999)
         assert trademark is None
     
+    def test_find_by_ids(self, mock_repository):
+        """여러 ID로 상표 조회 테스트"""
+        trademarks = mock_repository.find_by_ids([3, 1, 999, 3])
+        
+        # 요청 순서 유지, 중복 및 존재하지 않는 ID 제외
+        assert [t.id for t in trademarks] == [3, 1]
+        assert mock_repository.find_by_ids([]) == []
+    
     def test_search_with_query(self, mock_repository):
         """검색어를 이용한 상표 검색 테스트"""
         # 검색 파라미터 생성
@@ -36,6 +48,18 @@ class TestMockTrademarkRepository:
         assert len(results) == 1
         assert results[0].productName == "스타벅스"
     
+    def test_search_query_is_case_insensitive(self, mock_repository):
+        """대소문자/유니코드 케이스 무시 검색 테스트 (casefold 비교)"""
+        mock_repository.create(Trademark(applicationNumber="40-2023-0007", productNameEng="Straße Coffee", registerStatus="출원"))
+        
+        # 필터 없는 전체 검색과 필터가 있는 후보 검색 모두 확인
+        results, total = mock_repository.search(TrademarkSearchParams(query="STRASSE"))
+        assert total == 1
+        assert results[0].productNameEng == "Straße Coffee"
+        
+        results, total = mock_repository.search(TrademarkSearchParams(query="strasse", status="출원"))
+        assert total == 1
+    
     def test_search_with_status_filter(self, mock_repository):
         """상태 필터를 이용한 검색 테스트"""
         # 등록 상태 필터 검색
@@ -167,6 +191,53 @@ class TestMockTrademarkRepository:
         after_update = mock_repository.find_by_id(created_id)
         assert after_update.registerStatus == "등록"
     
+    def test_search_order_is_same_with_and_without_filter(self):
+        """필터 유무와 관계없이 결과가 같은 순서(저장 순서)로 페이징되는지 테스트"""
+        repository = MockTrademarkRepository()
+        # ID 순서와 저장 순서가 다르도록 생성
+        for id in (30, 10, 20):
+            repository.create(Trademark(
+                id=id, applicationNumber=f"40-2023-{id:04d}", productName=f"커피{id}",
+                registerStatus="등록", asignProductMainCodeList=["43"]
+            ))
+        
+        expected = [30, 10, 20]
+        for params in (
+            {},
+            {"status": "등록"},
+            {"product_code": "43"},
+            {"q": "커피"},
+            {"q": "커피", "status": "등록"},
+        ):
+            pages = [
+                [t.id for t in repository.search(TrademarkSearchParams(**params, limit=2, offset=offset))[0]]
+                for offset in (0, 2)
+            ]
+            assert pages == [expected[:2], expected[2:]], params
+        
+        # 상태가 바뀌었다가 돌아와도 저장 순서 유지 (역인덱스 재등록 순서와 무관)
+        for status in ("출원", "등록"):
+            entity = repository.find_by_id(10)
+            entity.registerStatus = status
+            repository.update(entity)
+        results, _ = repository.search(TrademarkSearchParams(status="등록"))
+        assert [t.id for t in results] == expected
+    
+    def test_create_many(self, mock_repository):
+        """상표 일괄 생성 테스트"""
+        created = mock_repository.create_many([
+            Trademark(applicationNumber="40-2023-0005", productName="빽다방", registerStatus="출원"),
+            Trademark(applicationNumber="40-2023-0006", productName="메가커피", registerStatus="출원")
+        ])
+        
+        # 생성 결과 검증 - 순서 유지 및 ID 할당
+        assert [t.productName for t in created] == ["빽다방", "메가커피"]
+        assert len({t.id for t in created}) == 2
+        
+        # 검색 인덱스 반영 확인
+        results, total = mock_repository.search(TrademarkSearchParams(status="출원"))
+        assert {"빽다방", "메가커피"} <= {t.productName for t in results}
+    
     def test_delete(self, mock_repository):
         """상표 삭제 테스트"""
         # 삭제 전 확인
@@ -187,6 +258,26 @@ class TestMockTrademarkRepository:
         result = mock_repository.delete(999)
         assert result == False
     
+    def test_search_index_follows_update_and_delete(self, mock_repository):
+        """수정/삭제 후 필터 검색 결과 반영 테스트"""
+        # 커피빈 상태 변경 (출원 -> 등록)
+        coffeebean = mock_repository.find_by_id(2)
+        coffeebean.registerStatus = "등록"
+        mock_repository.update(coffeebean)
+        
+        results, total = mock_repository.search(TrademarkSearchParams(status="등록"))
+        assert total == 3
+        results, total = mock_repository.search(TrademarkSearchParams(status="출원"))
+        assert total == 0
+        
+        # 삭제 후 상품 코드 필터에서 제외되는지 확인
+        mock_repository.delete(3)
+        results, total = mock_repository.search(TrademarkSearchParams(product_code="09"))
+        assert total == 0
+        results, total = mock_repository.search(TrademarkSearchParams(status="등록", product_code="43"))
+        assert total == 2
+        assert [r.id for r in results] == [1, 2]
+    
     def test_get_register_statuses(self, mock_repository):
         """등록 상태 목록 조회 테스트"""
         statuses = mock_repository.get_register_statuses()
@@ -202,4 +293,166 @@ class TestMockTrademarkRepository:
         assert len(codes) == 7
         assert "01" in codes
         assert "42" in codes
-        assert "43" in codes
\ No newline at end of file
+        assert "43" in codes
+
+class TestPostgresTrademarkRepositoryQuery:
+    """PostgreSQL 상표 저장소 쿼리 구성 테스트 (DB 연결 없이 SQL 구조만 확인)"""
+    
+    @staticmethod
+    def _cache_key(params: TrademarkSearchParams):
+        repository = PostgresTrademarkRepository(db=None)
+        query = repository._apply_filters(select(Trademark), params)
+        if params.query:
+            query = repository._apply_search_conditions(query, params.query)
+        return query._generate_cache_key().key
+    
+    def test_search_query_cache_key_is_independent_of_values(self):
+        """검색어/필터 값이 달라도 컴파일 캐시 키가 동일한지 테스트"""
+        # 한글/영문 검색어 (바인드 파라미터 타입 추론 차이로 캐시가 나뉘지 않아야 함)
+        assert self._cache_key(TrademarkSearchParams(q="스타벅스", status="등록")) == \
+            self._cache_key(TrademarkSearchParams(q="coffee", status="출원"))
+        
+        # 초성 검색어
+        assert self._cache_key(TrademarkSearchParams(q="ㅅㅂ")) == self._cache_key(TrademarkSearchParams(q="ㄱㄴㄷ"))
+        
+        # 날짜 범위 필터
+        assert self._cache_key(TrademarkSearchParams(q="a", from_date="20200101")) == \
+            self._cache_key(TrademarkSearchParams(q="b", from_date="20210101"))
+    
+    def test_copy_columns_exclude_derived_columns(self):
+        """COPY 적재 컬럼에서 트리거/생성 컬럼이 제외되는지 테스트"""
+        assert _COPY_COLUMNS[0] == 'id'
+        for name in ('search_vector', 'search_trgm', 'product_name_initial'):
+            assert name not in _COPY_COLUMNS
+        # 스테이징 테이블도 적재 컬럼만 가짐
+        assert "LIKE trademarks" not in _STAGE_TABLE_DDL
+        assert "search_trgm" not in _STAGE_TABLE_DDL
+        # 충돌 시 입력된 컬럼 중 id 외 컬럼만 갱신
+        _, upsert_sql = _copy_statements(('id', 'productName'))
+        assert '"id" = EXCLUDED' not in upsert_sql
+        assert 'SET "productName" = EXCLUDED."productName"' in upsert_sql
+        assert '"productNameEng"' not in upsert_sql
+    
+    def test_copy_insert_updates_only_given_columns(self):
+        """COPY 적재가 키 조합별로 입력된 컬럼만 적재/갱신하는지 테스트 (누락 키로 기존 값을 NULL로 덮어쓰지 않음)"""
+        db = MagicMock()
+        cursor = db.connection().connection.driver_connection.cursor.return_value.__enter__.return_value
+        copy = cursor.copy.return_value.__enter__.return_value
+        
+        count = PostgresTrademarkRepository(db=db).copy_insert([
+            {"id": 1, "productName": "스타벅스", "registerStatus": "등록"},
+            {"id": 2, "productName": "커피빈"},
+            {"registerStatus": "출원", "id": 3, "productName": "삼성전자"},
+        ])
+        
+        assert count == 3
+        assert [call.args[0] for call in cursor.copy.call_args_list] == [
+            'COPY trademarks_stage ("id", "productName", "registerStatus") FROM STDIN',
+            'COPY trademarks_stage ("id", "productName") FROM STDIN',
+        ]
+        # 행 값은 COPY 컬럼 순서대로 전달
+        assert [call.args[0] for call in copy.write_row.call_args_list] == [
+            (1, "스타벅스", "등록"), (3, "삼성전자", "출원"), (2, "커피빈"),
+        ]
+        executed = [call.args[0] for call in cursor.execute.call_args_list]
+        assert executed == [
+            _STAGE_TABLE_DDL,
+            _copy_statements(('id', 'productName', 'registerStatus'))[1],
+            "TRUNCATE trademarks_stage",
+            _copy_statements(('id', 'productName'))[1],
+        ]
+        assert '"registerStatus"' not in executed[3]
+        db.commit.assert_called_once()
+    
+    def test_copy_insert_rejects_unknown_columns(self):
+        """알 수 없는 키나 검색용 컬럼이 포함되면 적재 전에 오류를 발생시키는지 테스트"""
+        db = MagicMock()
+        repository = PostgresTrademarkRepository(db=db)
+        with pytest.raises(ValueError, match="productname"):
+            repository.copy_insert([{"id": 1, "productname": "스타벅스"}])
+        with pytest.raises(ValueError, match="search_trgm"):
+            repository.copy_insert([{"id": 1, "search_trgm": "스타벅스"}])
+        db.connection.assert_not_called()
+        assert repository.copy_insert([]) == 0
+    
+    def test_search_columns_are_not_selected(self):
+        """검색용 파생 컬럼이 조회 SELECT 목록에서 제외되는지 테스트"""
+        sql = str(select(Trademark))
+        assert '"productName"' in sql
+        for name in ('search_vector', 'search_trgm', 'product_name_initial'):
+            assert name not in sql
+    
+    @staticmethod
+    def _filter_sql(params: TrademarkSearchParams) -> str:
+        repository = PostgresTrademarkRepository(db=None)
+        query = repository._apply_filters(select(Trademark.id), params)
+        return str(query.compile(dialect=postgresql.dialect()))
+    
+    def test_registration_date_filter_uses_array_elements(self):
+        """등록일(date[] 배열) 범위 필터가 배열 원소 단위 EXISTS 조건으로 생성되는지 테스트"""
+        sql = self._filter_sql(TrademarkSearchParams(
+            date_type="registrationDate", from_date="20230101", to_date="20231231"
+        ))
+        assert "EXISTS (SELECT date_element" in sql
+        assert 'unnest(trademarks."registrationDate")' in sql
+        assert "date_element >= " in sql and "date_element <= " in sql
+        # 배열 컬럼과 날짜를 직접 비교하지 않음 (PostgreSQL에 date[] >= date 연산자 없음)
+        assert 'trademarks."registrationDate" >=' not in sql
+        assert 'trademarks."registrationDate" <=' not in sql
+        
+        # 한쪽 경계만 지정한 경우
+        sql = self._filter_sql(TrademarkSearchParams(date_type="registrationDate", to_date="20231231"))
+        assert "date_element <= " in sql and "date_element >= " not in sql
+    
+    def test_scalar_date_filter_compares_column_directly(self):
+        """출원일/공고일 범위 필터는 컬럼을 직접 비교하는지 테스트 (복합 인덱스 사용)"""
+        sql = self._filter_sql(TrademarkSearchParams(
+            date_type="publicationDate", from_date="20230101", to_date="20231231"
+        ))
+        assert 'trademarks."publicationDate" >=' in sql
+        assert 'trademarks."publicationDate" <=' in sql
+        assert "unnest" not in sql
+    
+    def test_fuzzy_search_sets_similarity_threshold(self):
+        """검색어가 있으면 %> 임계값(기존 similarity > 0.3 기준)을 바인드 파라미터로 먼저 지정하는지 테스트"""
+        db = MagicMock()
+        db.execute.return_value.all.return_value = []
+        PostgresTrademarkRepository(db=db).search(TrademarkSearchParams(query="스타벅스"))
+        
+        statement, bind_params = db.execute.call_args_list[0].args
+        assert "set_config('pg_trgm.word_similarity_threshold', :threshold, true)" in str(statement)
+        assert bind_params == {"threshold": "0.3"}
+        
+        # 필터만 있는 검색은 유사도 조건이 없으므로 임계값을 지정하지 않음
+        db.reset_mock()
+        PostgresTrademarkRepository(db=db).search(TrademarkSearchParams(status="등록"))
+        assert "set_config" not in str(db.execute.call_args_list[0].args[0])
+    
+    def test_window_count_only_on_filter_only_search(self):
+        """검색어 쿼리는 COUNT(*) OVER() 없이 페이지를 조회하고 전체 페이지인 경우에만 별도 카운트하는지 테스트"""
+        def executed_sql(db):
+            return [str(call.args[0].compile(dialect=postgresql.dialect())) for call in db.execute.call_args_list[1:]]
+        
+        # 마지막 페이지 (limit 미만) - 카운트 쿼리 생략
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [Trademark(id=1)]
+        results, total = PostgresTrademarkRepository(db=db).search(TrademarkSearchParams(query="스타벅스", offset=20, limit=10))
+        statements = executed_sql(db)
+        assert total == 21 and len(results) == 1
+        assert len(statements) == 1
+        assert "OVER" not in statements[0] and "LIMIT" in statements[0]
+        
+        # 전체 페이지 - 총 결과 수는 별도 카운트
+        db = MagicMock()
+        db.execute.return_value.scalars.return_value = [Trademark(id=i) for i in range(10)]
+        db.execute.return_value.scalar.return_value = 42
+        _, total = PostgresTrademarkRepository(db=db).search(TrademarkSearchParams(query="스타벅스", limit=10))
+        statements = executed_sql(db)
+        assert total == 42
+        assert len(statements) == 2
+        assert "count(*)" in statements[1] and "ORDER BY" not in statements[1]
+        
+        # 필터만 있는 검색은 윈도우 함수로 한 번에 조회
+        db = MagicMock()
+        PostgresTrademarkRepository(db=db).search(TrademarkSearchParams(status="등록"))
+        assert "count(*) OVER ()" in str(db.execute.call_args_list[0].args[0].compile(dialect=postgresql.dialect()))
\ No newline at end of file
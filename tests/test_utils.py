@@ -7,9 +7,10 @@ from app.utils.search import (
     extract_initial_consonants, 
     matches_initial_consonants
 )
-from app.utils.dto import to_schema, to_schema_list
+from app.utils.dto import to_schema, to_schema_fast, to_schema_list
+from app.utils.dates import parse_yyyymmdd
 from app.models.trademark import Trademark
-from app.schemas.trademark import SearchResult
+from app.schemas.trademark import SearchResult, TrademarkDetail, TrademarkSearchParams
 from datetime import date
 
 class TestSearchUtils:
@@ -39,6 +40,10 @@ class TestSearchUtils:
         assert extract_initial_consonants("스타벅스") == "ㅅㅌㅂㅅ"
         assert extract_initial_consonants("Hello 안녕") == "Hello ㅇㄴ"
         assert extract_initial_consonants("123 가나다") == "123 ㄱㄴㄷ"
+        
+        # 변환 테이블이 모든 한글 음절에 대해 get_initial_consonant와 일치하는지 확인
+        syllables = "".join(chr(code) for code in range(0xAC00, 0xD7A4))
+        assert extract_initial_consonants(syllables) == "".join(get_initial_consonant(c) for c in syllables)
     
     def test_matches_initial_consonants(self):
         """초성 매칭 함수 테스트"""
@@ -56,6 +61,12 @@ class TestSearchUtils:
         assert calculate_similarity("스타벅스", "타벅스") > 0.6
         assert calculate_similarity("스타벅스", "커피빈") < 0.3
         assert calculate_similarity("스타벅스", "스타") > 0.8  
+        
+        # score_cutoff: 기준 이상이면 같은 값, 미만이면 0.0
+        assert calculate_similarity("스타벅스", "스타박스", score_cutoff=0.6) == calculate_similarity("스타벅스", "스타박스")
+        assert calculate_similarity("스타벅스", "커피빈", score_cutoff=0.6) == 0.0
+        # 길이 차이만으로 기준 미달 (최대 2*2/(2+10))
+        assert calculate_similarity("스타", "스타벅스커피빈코리아", score_cutoff=0.6) == 0.0
     
     def test_fuzzy_match(self):
         """퍼지 매칭 함수 테스트"""
@@ -130,4 +141,101 @@ class TestDtoUtils:
         assert to_schema_list([], SearchResult) == []
         
         # None 테스트
-        assert to_schema_list(None, SearchResult) == []
\ No newline at end of file
+        assert to_schema_list(None, SearchResult) == []
+    
+    def test_to_schema_fast_matches_validated(self):
+        """검증 생략 변환 결과가 model_validate 결과와 동일한지 테스트"""
+        trademark = Trademark(
+            applicationNumber="40-2023-0001",
+            productName="스타벅스",
+            applicationDate=date(2023, 1, 1),
+            registerStatus="등록",
+            registrationNumber=["4000001"],
+            registrationDate=[date(2023, 6, 1)]
+        )
+        
+        fast = to_schema_fast(trademark, TrademarkDetail)
+        validated = to_schema(trademark, TrademarkDetail)
+        
+        assert fast.model_dump() == validated.model_dump()
+        # 모델에 없는 속성은 스키마 기본값 사용
+        assert to_schema_fast(trademark, SearchResult).similarity_score is None
+        assert to_schema_fast(None, TrademarkDetail) is None
+    
+    def test_to_schema_fast_null_arrays_match_validated(self):
+        """NULL 배열 컬럼이 두 변환 경로에서 동일하게(null) 직렬화되는지 테스트"""
+        trademark = Trademark(applicationNumber="40-2023-0001", productName="스타벅스")
+        
+        for schema_class in (SearchResult, TrademarkDetail):
+            fast = to_schema_fast(trademark, schema_class).model_dump(mode="json")
+            validated = to_schema(trademark, schema_class).model_dump(mode="json")
+            
+            assert fast == validated
+            assert fast["registrationNumber"] is None
+            assert fast["registrationDate"] is None
+            assert fast["asignProductMainCodeList"] is None
+    
+    def test_to_schema_list_validated_path(self, monkeypatch):
+        """빠른 변환을 끈 경우 TypeAdapter 검증 경로 테스트"""
+        monkeypatch.setattr("app.utils.dto.TRUSTED_FAST_CONVERSION", False)
+        trademarks = [
+            Trademark(applicationNumber="40-2023-0001", productName="스타벅스"),
+            Trademark(applicationNumber="40-2023-0002", productName="커피빈")
+        ]
+        
+        results = to_schema_list(trademarks, SearchResult)
+        
+        assert [r.applicationNumber for r in results] == ["40-2023-0001", "40-2023-0002"]
+        assert all(isinstance(r, SearchResult) for r in results)
+    
+    def test_date_fields_serialize_as_yyyymmdd(self):
+        """응답 스키마의 날짜 필드가 JSON에서 YYYYMMDD 형식으로 직렬화되는지 테스트"""
+        result = SearchResult(
+            applicationNumber="40-2023-0001",
+            applicationDate=date(2023, 1, 2),
+            registrationDate=[date(2023, 5, 6)]
+        )
+        
+        data = result.model_dump(mode="json")
+        assert data["applicationDate"] == "20230102"
+        assert data["registrationDate"] == ["20230506"]
+        # Python 모드에서는 date 객체 유지
+        assert result.model_dump()["applicationDate"] == date(2023, 1, 2)
+        
+        detail = TrademarkDetail(applicationNumber="40-2023-0001", publicationDate=None)
+        assert detail.model_dump(mode="json")["publicationDate"] is None
+
+class TestDateUtils:
+    """날짜 유틸리티 함수 테스트"""
+    
+    def test_parse_yyyymmdd(self):
+        """YYYYMMDD 문자열 변환 테스트"""
+        assert parse_yyyymmdd("20230101") == date(2023, 1, 1)
+        assert parse_yyyymmdd("20240229") == date(2024, 2, 29)
+        
+        # 형식 오류 및 존재하지 않는 날짜
+        for value in ["2023010", "2023-01-01", "２０２３０１０１", "20231340", "20230229"]:
+            with pytest.raises(ValueError):
+                parse_yyyymmdd(value)
+
+class TestSearchParamsValidation:
+    """검색 파라미터 검증 테스트"""
+    
+    def test_date_format(self):
+        """YYYYMMDD 날짜 형식 검증 테스트"""
+        assert TrademarkSearchParams(from_date="20230101").from_date == "20230101"
+        
+        for value in ["2023010", "2023-01-01", "20230101\n", "２０２３０１０１"]:
+            with pytest.raises(ValueError):
+                TrademarkSearchParams(from_date=value)
+    
+    def test_date_range(self):
+        """날짜 범위 검증 테스트"""
+        assert TrademarkSearchParams(from_date="20230101", to_date="20231231").to_date == "20231231"
+        
+        with pytest.raises(ValueError, match="시작 날짜는 종료 날짜보다 이전이어야 합니다"):
+            TrademarkSearchParams(from_date="20231231", to_date="20230101")
+        
+        # 형식은 맞지만 존재하지 않는 날짜
+        with pytest.raises(ValueError, match="잘못된 날짜 형식"):
+            TrademarkSearchParams(from_date="20231340", to_date="20240101")
\ No newline at end of file